@@ -0,0 +1 @@
+"""Custom agents for the Cybersecurity AI Agent Platform"""
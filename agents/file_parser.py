@@ -9,7 +9,6 @@ import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-import hashlib
 import mimetypes
 
 import PyPDF2
@@ -19,10 +18,10 @@ import google.generativeai as genai
 from loguru import logger
 import yaml
 
-from rag_embedder import RAGEmbedder
+from agents.rag_embedder import RAGEmbedder
 from core.shared_utils import (
     ConfigManager, LoggerManager, GeminiClient,
-    DirectoryManager, PromptTemplates, FileHandler
+    DirectoryManager, PromptTemplates, FileHandler, YAMLLoader
 )
 
 class FileParser:
@@ -364,8 +363,7 @@ Focus on practical security insights, vulnerabilities, attack methods, and defen
         file_stats = os.stat(file_path)
         
         # Generate content hash for deduplication
-        with open(file_path, 'rb') as f:
-            content_hash = hashlib.md5(f.read()).hexdigest()
+        content_hash = await asyncio.to_thread(FileHandler.file_hash, file_path)
         
         metadata = {
             'filename': os.path.basename(file_path),
@@ -561,7 +559,7 @@ if __name__ == "__main__":
     # Test the file parser
     async def test_file_parser():
         with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAMLLoader)
         
         parser = FileParser(config)
         
@@ -6,7 +6,6 @@ Real-time monitoring and alerts for the platform
 
 import asyncio
 import json
-import os
 import sys
 import time
 from datetime import datetime, timedelta
@@ -76,8 +75,7 @@ class SystemHealthMonitor:
         """Check Telegram bot health"""
         try:
             # Check if bot token is configured
-            bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-            if not bot_token or bot_token.startswith('your_'):
+            if not ConfigManager.get_instance().get_api_key('telegram'):
                 return {'status': 'error', 'message': 'Bot token not configured'}
             
             # Check bot process (simplified check)
@@ -17,11 +17,15 @@ from google.generativeai.types import HarmCategory, HarmBlockThreshold
 from loguru import logger
 import yaml
 
-from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager, GeminiClient
+from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager, GeminiClient, YAMLLoader
+from core.llm_batcher import LLMBatcher
 
 class PentestGPTGemini:
     """Enhanced PentestGPT using only Gemini for all AI reasoning"""
     
+    # One batcher for every instance, so the bot, router and platform share batches
+    _batcher: Optional[LLMBatcher] = None
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         LoggerManager.setup_logger('pentestgpt_gemini')
@@ -407,11 +411,11 @@ Provide actionable security intelligence from traffic analysis."""
             # Step 3: Attack Vector Identification
             attack_vectors = await self._identify_attack_vectors(query, detailed_analysis)
             
-            # Step 4: Mitigation Strategies
-            mitigation_strategies = await self._generate_mitigation_strategies(query, attack_vectors)
-            
-            # Step 5: Risk Assessment
-            risk_assessment = await self._assess_risk_level(query, attack_vectors)
+            # Steps 4 and 5 both build on the attack vectors, so they share one batch
+            mitigation_strategies, risk_assessment = await asyncio.gather(
+                self._generate_mitigation_strategies(query, attack_vectors),
+                self._assess_risk_level(query, attack_vectors)
+            )
             
             # Compile results
             result = {
@@ -630,16 +634,45 @@ Return assessment in this JSON format:
             }
 
     async def _call_gemini(self, prompt: str) -> str:
-        """Call Gemini API directly using configured model"""
+        """Call Gemini API through the shared request batcher"""
         try:
             if not self.model:
                 raise ValueError("Gemini model not initialized")
             
-            response = self.model.generate_content(prompt)
-            return response.text if response and response.text else "No response generated"
+            return await self.batcher.submit(prompt)
         except Exception as e:
             logger.error(f"Gemini API call failed: {e}")
             raise
+    
+    async def _generate_batch(self, prompts: List[str]) -> List[Any]:
+        """Send one batch of prompts to Gemini, returning a response or exception per prompt"""
+        responses = await asyncio.gather(
+            *(asyncio.to_thread(self.model.generate_content, prompt) for prompt in prompts),
+            return_exceptions=True
+        )
+        
+        return [
+            response if isinstance(response, Exception)
+            else response.text if response and response.text else "No response generated"
+            for response in responses
+        ]
+    
+    @property
+    def batcher(self) -> LLMBatcher:
+        """Request batcher shared by all instances, created on first use or after close()"""
+        cls = type(self)
+        if cls._batcher is None or cls._batcher.closed:
+            # Every instance configures the same model, so any of them can serve the batch
+            cls._batcher = LLMBatcher(
+                self._generate_batch,
+                max_batch_size=self.config.get('pentestgpt', {}).get('batch_size', 8)
+            )
+        return cls._batcher
+    
+    async def close(self):
+        """Flush pending prompts and stop the shared batcher"""
+        if type(self)._batcher is not None:
+            await type(self)._batcher.close()
 
     async def _call_azure_openai(self, prompt: str) -> str:
         """Call Azure OpenAI API (placeholder)"""
@@ -785,7 +818,7 @@ if __name__ == "__main__":
     # Test the PentestGPT functionality
     async def test_pentestgpt():
         with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAMLLoader)
         
         pentestgpt = PentestGPT(config)
         
@@ -4,12 +4,12 @@ Handles vector embeddings and ChromaDB storage
 """
 
 import asyncio
-import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 import hashlib
+import threading
 
 import chromadb
 from chromadb.config import Settings
@@ -18,9 +18,30 @@ import numpy as np
 from loguru import logger
 import yaml
 
-from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager
+from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager, JSONHandler, YAMLLoader
+
+# One persistent Chroma client per database path, shared by every RAGEmbedder in the process
+_chroma_clients: Dict[str, Any] = {}
+_chroma_clients_lock = threading.Lock()
+
+def get_chroma_client(path: str) -> Any:
+    """Open the Chroma database at path once and reuse the client afterwards"""
+    key = os.path.abspath(path)
+    # Embedders are built from executor threads, so guard the first open
+    with _chroma_clients_lock:
+        client = _chroma_clients.get(key)
+        if client is None:
+            client = chromadb.PersistentClient(
+                path=key,
+                settings=Settings(anonymized_telemetry=False)
+            )
+            _chroma_clients[key] = client
+        return client
 
 class RAGEmbedder:
+    # Bumped whenever any instance adds documents, so result caches can tell when they are stale
+    corpus_version = 0
+    
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or ConfigManager.get_instance().config
         self.embedding_model_name = self.config['rag']['embedding_model']
@@ -81,11 +102,8 @@ class RAGEmbedder:
             chroma_db_path = Path(self.config.get('chroma_db_path', './rag_data/chroma_db'))
             chroma_db_path.mkdir(parents=True, exist_ok=True)
             
-            # Initialize ChromaDB client
-            self.chroma_client = chromadb.PersistentClient(
-                path=str(chroma_db_path),
-                settings=Settings(anonymized_telemetry=False)
-            )
+            # Initialize ChromaDB client (shared across embedders)
+            self.chroma_client = get_chroma_client(str(chroma_db_path))
             
             # Initialize collections for each category
             collection_configs = self.config['rag']['collections']
@@ -141,6 +159,7 @@ class RAGEmbedder:
                 ids=[doc_id]
             )
             
+            RAGEmbedder.corpus_version += 1
             logger.info(f"Added document to {collection}: {doc_id}")
             return doc_id
             
@@ -148,15 +167,94 @@ class RAGEmbedder:
             logger.error(f"Failed to add document: {e}")
             raise
 
+    async def add_documents(self, contents: List[str], metadatas: List[Dict[str, Any]],
+                            collections: List[str], batch_size: int = 32) -> List[str]:
+        """Add multiple documents with a single batched embedding pass"""
+        try:
+            doc_ids = [
+                self._generate_document_id(content, metadata)
+                for content, metadata in zip(contents, metadatas)
+            ]
+            
+            # Group new documents by collection, skipping existing/duplicate IDs
+            pending: Dict[str, List[int]] = {}
+            seen = set()
+            for i, (doc_id, collection) in enumerate(zip(doc_ids, collections)):
+                if (collection, doc_id) not in seen:
+                    seen.add((collection, doc_id))
+                    pending.setdefault(collection, []).append(i)
+            
+            for collection, indices in list(pending.items()):
+                if collection in self.collections:
+                    existing = set(self.collections[collection].get(
+                        ids=[doc_ids[i] for i in indices]
+                    )['ids'])
+                    indices = [i for i in indices if doc_ids[i] not in existing]
+                if indices:
+                    pending[collection] = indices
+                else:
+                    del pending[collection]
+            
+            to_embed = [i for indices in pending.values() for i in indices]
+            if not to_embed:
+                return doc_ids
+            
+            # Generate all embeddings in one model call
+            embeddings = await asyncio.to_thread(
+                self.embedding_model.encode,
+                [contents[i] for i in to_embed],
+                batch_size=batch_size
+            )
+            embedding_by_index = dict(zip(to_embed, embeddings))
+            
+            for collection, indices in pending.items():
+                # Get or create collection
+                if collection not in self.collections:
+                    collection_obj = self.chroma_client.get_or_create_collection(
+                        name=collection,
+                        metadata={"description": f"Auto-created collection for {collection}"}
+                    )
+                    self.collections[collection] = collection_obj
+                else:
+                    collection_obj = self.collections[collection]
+                
+                collection_obj.add(
+                    documents=[contents[i] for i in indices],
+                    embeddings=[embedding_by_index[i].tolist() for i in indices],
+                    metadatas=[self._prepare_metadata(metadatas[i]) for i in indices],
+                    ids=[doc_ids[i] for i in indices]
+                )
+            
+            RAGEmbedder.corpus_version += 1
+            logger.info(f"Added {len(to_embed)} documents across {len(pending)} collections")
+            return doc_ids
+            
+        except Exception as e:
+            logger.error(f"Failed to add documents: {e}")
+            raise
+
     async def search_similar(self, query: str, collection: str = None, n_results: int = None) -> List[Dict[str, Any]]:
         """Search for similar documents"""
         try:
-            if n_results is None:
-                n_results = self.max_results
-            
             # Generate query embeddings
             query_embeddings = await self._generate_embeddings(query)
             
+            results = await self.search_similar_by_vector(query_embeddings, collection, n_results)
+            
+            logger.info(f"Found {len(results)} similar documents for query: {query[:50]}...")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            raise
+
+    async def search_similar_by_vector(self, query_embeddings: np.ndarray, collection: str = None,
+                                       n_results: int = None) -> List[Dict[str, Any]]:
+        """Search for similar documents with an already computed query embedding"""
+        try:
+            if n_results is None:
+                n_results = self.max_results
+            
             results = []
             
             # Search in specific collection or all collections
@@ -178,6 +276,7 @@ class RAGEmbedder:
                     
                     if similarity_score >= self.similarity_threshold:
                         results.append({
+                            'id': search_results['ids'][0][i],
                             'content': search_results['documents'][0][i],
                             'metadata': search_results['metadatas'][0][i],
                             'similarity_score': similarity_score,
@@ -187,11 +286,34 @@ class RAGEmbedder:
             # Sort by similarity score
             results.sort(key=lambda x: x['similarity_score'], reverse=True)
             
-            logger.info(f"Found {len(results)} similar documents for query: {query[:50]}...")
             return results[:n_results]
             
         except Exception as e:
-            logger.error(f"Search failed: {e}")
+            logger.error(f"Vector search failed: {e}")
+            raise
+
+    async def search_ids_by_vector(self, query_embeddings: np.ndarray, n_results: int = None) -> Set[str]:
+        """IDs of the documents search_similar_by_vector would return, without fetching content"""
+        try:
+            if n_results is None:
+                n_results = self.max_results
+            
+            scored = []
+            for collection_obj in self.collections.values():
+                search_results = collection_obj.query(
+                    query_embeddings=[query_embeddings.tolist()],
+                    n_results=min(n_results, collection_obj.count()),
+                    include=['distances']
+                )
+                for doc_id, distance in zip(search_results['ids'][0], search_results['distances'][0]):
+                    if 1.0 - distance >= self.similarity_threshold:
+                        scored.append((1.0 - distance, doc_id))
+            
+            scored.sort(reverse=True)
+            return {doc_id for _, doc_id in scored[:n_results]}
+            
+        except Exception as e:
+            logger.error(f"ID search failed: {e}")
             raise
 
     async def search_by_category(self, category: str, query: str = None, n_results: int = None) -> List[Dict[str, Any]]:
@@ -283,14 +405,24 @@ class RAGEmbedder:
             logger.error(f"Tag search failed: {e}")
             raise
 
-    async def get_context_for_query(self, query: str, max_context_length: int = 2000) -> str:
+    async def get_context_for_query(self, query: str, max_context_length: int = 2000,
+                                    query_embeddings: Optional[np.ndarray] = None) -> str:
         """Get relevant context for a query"""
+        context, _ = await self.get_context_with_evidence(query, max_context_length, query_embeddings)
+        return context
+
+    async def get_context_with_evidence(self, query: str, max_context_length: int = 2000,
+                                        query_embeddings: Optional[np.ndarray] = None) -> Tuple[str, Set[str]]:
+        """Get relevant context for a query and the IDs of the documents it was retrieved from"""
         try:
             # Search for relevant documents
-            relevant_docs = await self.search_similar(query, n_results=5)
+            if query_embeddings is not None:
+                relevant_docs = await self.search_similar_by_vector(query_embeddings, n_results=5)
+            else:
+                relevant_docs = await self.search_similar(query, n_results=5)
             
             if not relevant_docs:
-                return "No relevant context found."
+                return "No relevant context found.", set()
             
             # Build context string
             context_parts = []
@@ -316,11 +448,23 @@ class RAGEmbedder:
             
             context = "\n".join(context_parts)
             logger.info(f"Generated context of {len(context)} characters for query")
-            return context
+            return context, {doc['id'] for doc in relevant_docs}
             
         except Exception as e:
             logger.error(f"Context generation failed: {e}")
-            return "Error generating context."
+            return "Error generating context.", set()
+
+    async def embed(self, query: str) -> np.ndarray:
+        """Embed a query with the model used for similarity search"""
+        return await self._generate_embeddings(query)
+
+    async def embed_batch(self, queries: List[str], batch_size: int = 32) -> np.ndarray:
+        """Embed several queries in one model call"""
+        try:
+            return await asyncio.to_thread(self.embedding_model.encode, queries, batch_size=batch_size)
+        except Exception as e:
+            logger.error(f"Batch embedding generation failed: {e}")
+            raise
 
     async def _generate_embeddings(self, text: str) -> np.ndarray:
         """Generate embeddings for text"""
@@ -360,10 +504,8 @@ class RAGEmbedder:
         for key, value in metadata.items():
             if isinstance(value, (str, int, float, bool)):
                 processed_metadata[key] = str(value)
-            elif isinstance(value, list):
-                processed_metadata[key] = json.dumps(value)
-            elif isinstance(value, dict):
-                processed_metadata[key] = json.dumps(value)
+            elif isinstance(value, (list, dict)):
+                processed_metadata[key] = JSONHandler.dumps(value).decode('utf-8')
             else:
                 processed_metadata[key] = str(value)
         
@@ -468,8 +610,8 @@ class RAGEmbedder:
                 'embeddings': all_data['embeddings']
             }
             
-            with open(backup_path, 'w') as f:
-                json.dump(backup_data, f, indent=2)
+            with open(backup_path, 'wb') as f:
+                f.write(JSONHandler.dumps(backup_data, indent=True))
             
             logger.info(f"Backed up collection {collection} to {backup_path}")
             return True
@@ -482,7 +624,7 @@ if __name__ == "__main__":
     # Test the RAG embedder
     async def test_rag_embedder():
         with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAMLLoader)
         
         embedder = RAGEmbedder(config)
         
@@ -4,7 +4,6 @@ Generates markdown and PDF reports from collected data
 """
 
 import asyncio
-import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -15,7 +14,7 @@ from loguru import logger
 import yaml
 from jinja2 import Template
 
-from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager, SystemMetrics
+from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager, SystemMetrics, JSONHandler, YAMLLoader
 
 class ReportGenerator:
     def __init__(self, config: Dict[str, Any] = None):
@@ -657,8 +656,8 @@ This comprehensive report provides an analysis of the cybersecurity AI agent's p
                 if category_dir.is_dir() and category_dir.name != 'chroma_db':
                     for article_file in category_dir.glob(f"*{date_str}.json"):
                         try:
-                            with open(article_file, 'r') as f:
-                                article_data = json.load(f)
+                            with open(article_file, 'rb') as f:
+                                article_data = JSONHandler.loads(f.read())
                                 articles.append(article_data)
                         except Exception:
                             continue
@@ -676,8 +675,8 @@ This comprehensive report provides an analysis of the cybersecurity AI agent's p
                 date_str = date.strftime('%Y%m%d')
                 for scan_file in scans_dir.glob(f"*{date_str}*.json"):
                     try:
-                        with open(scan_file, 'r') as f:
-                            scan_data = json.load(f)
+                        with open(scan_file, 'rb') as f:
+                            scan_data = JSONHandler.loads(f.read())
                             scans.append(scan_data)
                     except Exception:
                         continue
@@ -695,8 +694,8 @@ This comprehensive report provides an analysis of the cybersecurity AI agent's p
                 date_str = date.strftime('%Y%m%d')
                 for analysis_file in analyses_dir.glob(f"analysis_{date_str}*.json"):
                     try:
-                        with open(analysis_file, 'r') as f:
-                            analysis_data = json.load(f)
+                        with open(analysis_file, 'rb') as f:
+                            analysis_data = JSONHandler.loads(f.read())
                             analyses.append(analysis_data)
                     except Exception:
                         continue
@@ -715,8 +714,8 @@ This comprehensive report provides an analysis of the cybersecurity AI agent's p
                 if category_dir.is_dir() and category_dir.name != 'chroma_db':
                     for file_info in category_dir.glob("file_*.json"):
                         try:
-                            with open(file_info, 'r') as f:
-                                file_data = json.load(f)
+                            with open(file_info, 'rb') as f:
+                                file_data = JSONHandler.loads(f.read())
                                 
                             # Check if file was processed on the specified date
                             processed_date = file_data.get('processed_at', '')
@@ -852,7 +851,7 @@ if __name__ == "__main__":
     # Test the report generator
     async def test_report_generator():
         with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAMLLoader)
         
         generator = ReportGenerator(config)
         
@@ -4,27 +4,103 @@ Fetches and processes security-related RSS feeds
 """
 
 import asyncio
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import hashlib
 import re
 import os
+import sqlite3
+import tempfile
+from xml.etree import ElementTree
 
+import aiofiles
+import aiohttp
 import feedparser
-import requests
 from bs4 import BeautifulSoup
+import soupsieve
 import google.generativeai as genai
 from loguru import logger
 import yaml
 
-from rag_embedder import RAGEmbedder
+from agents.rag_embedder import RAGEmbedder
 from core.shared_utils import (
     ConfigManager, LoggerManager, GeminiClient,
-    DirectoryManager, PromptTemplates
+    DirectoryManager, PromptTemplates, JSONHandler, YAMLLoader
 )
 
+# Main-content selectors, compiled once and tried in priority order
+CONTENT_SELECTORS = [
+    soupsieve.compile(selector) for selector in (
+        'article', '.article-content', '.post-content',
+        '.entry-content', '.content', 'main', '.main'
+    )
+]
+
+# Feeds larger than this are spooled to a temporary file instead of memory
+FEED_SPOOL_MAX_SIZE = 1024 * 1024
+
+# Entry child elements (by local name) mapped to the fields _process_feed_entry reads;
+# the first element found for a field wins
+_ENTRY_FIELDS = {
+    'title': 'title',
+    'link': 'link',
+    'pubDate': 'published',
+    'published': 'published',
+    'date': 'published',
+    'updated': 'published',
+    'description': 'summary',
+    'summary': 'summary',
+    'content': 'summary',
+}
+
+def _local_name(tag: str) -> str:
+    """Element tag without its XML namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+def _iter_parse_entries(stream: Any, limit: int) -> List[Dict[str, str]]:
+    """Stream RSS, RDF or Atom entries with iterparse, stopping after limit entries"""
+    entries = []
+    
+    # expat takes the encoding from the XML declaration, so only the prefix is sniffed
+    for _, element in ElementTree.iterparse(stream, events=('end',)):
+        if _local_name(element.tag) not in ('item', 'entry'):
+            continue
+        
+        entry = {}
+        for child in element:
+            field = _ENTRY_FIELDS.get(_local_name(child.tag))
+            if field is None:
+                continue
+            
+            # Atom links carry the URL in href; prefer the alternate link
+            href = child.get('href')
+            if field == 'link' and href is not None:
+                if child.get('rel', 'alternate') == 'alternate' or 'link' not in entry:
+                    entry['link'] = href
+                continue
+            
+            entry.setdefault(field, (child.text or '').strip())
+        
+        # Drop the parsed subtree so memory stays bounded by one entry
+        element.clear()
+        entries.append(entry)
+        if len(entries) >= limit:
+            break
+    
+    return entries
+
+def _slugify(text: str) -> str:
+    """Lowercase slug safe for use as one underscore-separated filename field"""
+    return re.sub(r'[^a-z0-9]+', '-', str(text).lower()).strip('-') or 'unknown'
+
+def _score_for_filename(score: Any) -> int:
+    """Security score coerced to a non-negative integer for filenames"""
+    try:
+        return max(int(score), 0)
+    except (TypeError, ValueError):
+        return 0
+
 class RSSFetcher:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -43,8 +119,129 @@ class RSSFetcher:
         DirectoryManager.ensure_directory("rag_data")
         self.data_dir = Path("rag_data")
         
+        # Processed-hash log: loaded once, appended through a single handle
+        self._processed_hashes: Optional[set] = None
+        self._hash_file = None
+        self._hash_lock = asyncio.Lock()
+        
+        # Shared HTTP connection pool, created on first request
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Concurrency limits for feed downloads and per-entry processing
+        self.feed_concurrency = config.get('rss_feed_concurrency', 16)
+        self._entry_semaphore = asyncio.Semaphore(config.get('rss_entry_concurrency', 8))
+        
+        # Articles waiting to be embedded into the RAG database
+        self._rag_batch: List[Dict[str, Any]] = []
+        self.rag_batch_size = config.get('rss_rag_batch_size', 32)
+        
+        # Article index used to answer statistics without re-reading JSON files;
+        # opened by initialize(), rows are queued per article and committed once per feed
+        self._db = None
+        self._index_rows: List[tuple] = []
+        self._index_lock = asyncio.Lock()
+        
         logger.info("📡 RSS Fetcher initialized with shared utilities")
 
+    async def initialize(self):
+        """Open the article index off the event loop; later calls are no-ops"""
+        async with self._index_lock:
+            if self._db is None:
+                self._db = await asyncio.to_thread(self._open_article_index)
+
+    def _open_article_index(self) -> sqlite3.Connection:
+        """Open the SQLite article index and backfill it from saved JSON files"""
+        db = sqlite3.connect(str(self.data_dir / "articles.db"), check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS articles("
+            "id TEXT PRIMARY KEY, source TEXT, category TEXT, "
+            "security_score INTEGER, processed_at TEXT)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category)")
+        db.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)")
+        db.commit()
+        
+        if db.execute("SELECT 1 FROM articles LIMIT 1").fetchone() is None:
+            self._backfill_article_index(db)
+        return db
+
+    def _backfill_article_index(self, db: sqlite3.Connection):
+        """Index articles saved before the SQLite index existed"""
+        # Map filename slugs back to configured feed names
+        sources_by_slug = {
+            _slugify(feed_config['name']): feed_config['name']
+            for feeds in self.rss_feeds.values()
+            for feed_config in feeds
+        }
+        
+        rows = []
+        with os.scandir(self.data_dir) as data_entries:
+            category_entries = [
+                entry for entry in data_entries
+                if entry.is_dir() and entry.name != 'chroma_db'
+            ]
+        
+        for category_entry in category_entries:
+            with os.scandir(category_entry.path) as article_entries:
+                for article_entry in article_entries:
+                    if not article_entry.name.endswith('.json'):
+                        continue
+                    
+                    # {id}_{score}_{source}_{yyyymmdd}.json carries everything the
+                    # index needs; older {id}_{yyyymmdd}.json files are parsed
+                    parts = article_entry.name[:-len('.json')].split('_')
+                    if len(parts) == 4 and parts[1].isdigit():
+                        article_id, score, source_slug, stamp = parts
+                        try:
+                            # Same ISO format live inserts store from processed_at
+                            processed_at = datetime.strptime(stamp, '%Y%m%d').isoformat()
+                        except ValueError:
+                            processed_at = ''
+                        rows.append((
+                            article_id,
+                            sources_by_slug.get(source_slug, source_slug),
+                            category_entry.name,
+                            int(score),
+                            processed_at
+                        ))
+                        continue
+                    
+                    try:
+                        with open(article_entry.path, 'rb') as f:
+                            article = JSONHandler.loads(f.read())
+                        rows.append((
+                            article.get('id', parts[0]),
+                            article.get('source', 'unknown'),
+                            category_entry.name,
+                            article.get('security_score', 0),
+                            article.get('processed_at', '')
+                        ))
+                    except Exception as e:
+                        logger.error(f"Failed to index article {article_entry.path}: {e}")
+        
+        if rows:
+            db.executemany("INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?)", rows)
+            db.commit()
+            logger.info(f"Indexed {len(rows)} existing articles")
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it inside the running loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                },
+                timeout=aiohttp.ClientTimeout(total=30, connect=10)
+            )
+        return self._session
+
     async def fetch_all_feeds(self) -> Dict[str, Any]:
         """Fetch and process all configured RSS feeds"""
         logger.info("Starting RSS feed collection...")
@@ -56,36 +253,49 @@ class RSSFetcher:
         highlights = []
         
         try:
-            # Process each feed category
+            feed_configs = []
             for category, feeds in self.rss_feeds.items():
                 logger.info(f"Processing {category} feeds...")
+                feed_configs.extend(feeds)
+            
+            # Fetch all feeds concurrently under a bounded semaphore
+            feed_semaphore = asyncio.Semaphore(self.feed_concurrency)
+            
+            async def fetch_feed(feed_config: Dict[str, str]) -> List[Dict[str, Any]]:
+                async with feed_semaphore:
+                    return await self._fetch_and_process_feed(feed_config)
+            
+            feed_results = await asyncio.gather(
+                *(fetch_feed(feed_config) for feed_config in feed_configs),
+                return_exceptions=True
+            )
+            
+            for feed_config, articles in zip(feed_configs, feed_results):
+                if isinstance(articles, Exception):
+                    logger.error(f"Failed to process feed {feed_config['name']}: {articles}")
+                    continue
                 
-                for feed_config in feeds:
-                    try:
-                        articles = await self._fetch_and_process_feed(feed_config)
-                        
-                        # Update counters
-                        total_articles += len(articles)
-                        
-                        for article in articles:
-                            if article['category'] == 'vulnerabilities':
-                                new_cves += 1
-                            elif article['category'] == 'news':
-                                security_news += 1
-                            elif article['category'] == 'research':
-                                research_items += 1
-                            
-                            # Add interesting articles to highlights
-                            if article.get('security_score', 0) >= 7:
-                                highlights.append({
-                                    'title': article['title'],
-                                    'source': article['source'],
-                                    'score': article['security_score']
-                                })
+                # Update counters
+                total_articles += len(articles)
+                
+                for article in articles:
+                    if article['category'] == 'vulnerabilities':
+                        new_cves += 1
+                    elif article['category'] == 'news':
+                        security_news += 1
+                    elif article['category'] == 'research':
+                        research_items += 1
                     
-                    except Exception as e:
-                        logger.error(f"Failed to process feed {feed_config['name']}: {e}")
-                        continue
+                    # Add interesting articles to highlights
+                    if article.get('security_score', 0) >= 7:
+                        highlights.append({
+                            'title': article['title'],
+                            'source': article['source'],
+                            'score': article['security_score']
+                        })
+            
+            # Save any remaining queued articles to RAG
+            await self._flush_rag()
             
             # Sort highlights by score
             highlights.sort(key=lambda x: x['score'], reverse=True)
@@ -116,28 +326,58 @@ class RSSFetcher:
         logger.info(f"Fetching feed: {feed_name}")
         
         try:
-            # Fetch RSS feed
-            response = requests.get(feed_url, timeout=30)
-            response.raise_for_status()
-            
-            # Parse RSS feed
-            feed = feedparser.parse(response.content)
+            max_articles = self.config.get('rss_fetch_max_articles', 50)
             
-            if not feed.entries:
+            # Stream RSS feed into a spooled buffer (spills to disk for large feeds)
+            with tempfile.SpooledTemporaryFile(max_size=FEED_SPOOL_MAX_SIZE) as spool:
+                written = 0
+                async with self._get_session().get(feed_url) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get('Content-Type', '')
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        written += len(chunk)
+                        # Past max_size the spool is a real file, so write off the loop
+                        if written > FEED_SPOOL_MAX_SIZE:
+                            await asyncio.to_thread(spool.write, chunk)
+                        else:
+                            spool.write(chunk)
+                
+                # Parse incrementally, holding one entry at a time; malformed
+                # feeds fall back to feedparser, which reads the whole body
+                spool.seek(0)
+                try:
+                    entries = await asyncio.to_thread(_iter_parse_entries, spool, max_articles)
+                except ElementTree.ParseError:
+                    spool.seek(0)
+                    feed = await asyncio.to_thread(
+                        feedparser.parse,
+                        spool,
+                        response_headers={'content-type': content_type} if content_type else None
+                    )
+                    entries = feed.entries[:max_articles]
+            
+            if not entries:
                 logger.warning(f"No entries found in feed: {feed_name}")
                 return []
             
-            articles = []
-            max_articles = self.config.get('rss_fetch_max_articles', 50)
+            async def process_entry(entry: Any) -> Optional[Dict[str, Any]]:
+                async with self._entry_semaphore:
+                    return await self._process_feed_entry(entry, feed_name, category)
             
-            for entry in feed.entries[:max_articles]:
-                try:
-                    article = await self._process_feed_entry(entry, feed_name, category)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.error(f"Failed to process entry from {feed_name}: {e}")
-                    continue
+            entry_results = await asyncio.gather(
+                *(process_entry(entry) for entry in entries),
+                return_exceptions=True
+            )
+            
+            # One index commit per feed instead of one per article
+            await self._flush_article_index()
+            
+            articles = []
+            for article in entry_results:
+                if isinstance(article, Exception):
+                    logger.error(f"Failed to process entry from {feed_name}: {article}")
+                elif article:
+                    articles.append(article)
             
             logger.info(f"Processed {len(articles)} articles from {feed_name}")
             return articles
@@ -147,7 +387,8 @@ class RSSFetcher:
             raise
 
     async def _process_feed_entry(self, entry: Any, source: str, category: str) -> Optional[Dict[str, Any]]:
-        """Process a single RSS feed entry"""
+        """Process a single RSS feed entry and return its summary fields"""
+        claimed = False
         try:
             # Extract basic information
             title = entry.get('title', 'No title')
@@ -158,8 +399,9 @@ class RSSFetcher:
             # Create unique ID for deduplication
             content_hash = hashlib.md5(f"{title}{link}".encode()).hexdigest()
             
-            # Check if we've already processed this article
-            if await self._is_duplicate_article(content_hash):
+            # Reserve the article so the same entry in another feed is skipped
+            claimed = await self._claim_article(content_hash)
+            if not claimed:
                 return None
             
             # Extract full content if possible
@@ -196,9 +438,21 @@ class RSSFetcher:
             # Save to JSON file
             await self._save_article_json(article)
             
-            return article
+            # Return only the lightweight fields callers aggregate; the full
+            # article (content, tags, summary) lives on in RAG and on disk
+            return {
+                'id': article['id'],
+                'title': article['title'],
+                'url': article['url'],
+                'source': article['source'],
+                'category': article['category'],
+                'security_score': article['security_score']
+            }
             
         except Exception as e:
+            # Release our reservation so a later fetch can retry the article
+            if claimed:
+                self._processed_hashes.discard(content_hash)
             logger.error(f"Failed to process entry: {e}")
             return None
 
@@ -208,26 +462,20 @@ class RSSFetcher:
             return fallback_summary
         
         try:
-            response = requests.get(url, timeout=15, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            response.raise_for_status()
+            async with self._get_session().get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                response.raise_for_status()
+                page_content = await response.read()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(page_content, 'html.parser')
             
             # Remove script and style elements
             for script in soup(["script", "style"]):
                 script.decompose()
             
             # Try to find main content
-            content_selectors = [
-                'article', '.article-content', '.post-content', 
-                '.entry-content', '.content', 'main', '.main'
-            ]
-            
             content = ""
-            for selector in content_selectors:
-                element = soup.select_one(selector)
+            for selector in CONTENT_SELECTORS:
+                element = selector.select_one(soup)
                 if element:
                     content = element.get_text()
                     break
@@ -236,7 +484,7 @@ class RSSFetcher:
                 content = soup.get_text()
             
             # Clean up content
-            content = re.sub(r'\s+', ' ', content).strip()
+            content = ' '.join(content.split())
             
             return content[:5000] if content else fallback_summary  # Limit content length
             
@@ -280,9 +528,9 @@ Tags should include: vulnerability types, affected technologies, attack methods,
             
             # Parse JSON response
             try:
-                analysis = json.loads(response)
+                analysis = JSONHandler.loads(response)
                 return analysis
-            except json.JSONDecodeError:
+            except ValueError:
                 return self._basic_content_analysis(title, content, category)
                 
         except Exception as e:
@@ -335,35 +583,73 @@ Tags should include: vulnerability types, affected technologies, attack methods,
         
         return list(set(identifiers))  # Remove duplicates
 
-    async def _is_duplicate_article(self, content_hash: str) -> bool:
-        """Check if article has already been processed"""
-        duplicate_file = self.data_dir / "processed_hashes.txt"
+    async def _claim_article(self, content_hash: str) -> bool:
+        """Atomically check an article against the processed set and reserve it if new"""
+        if self._processed_hashes is None:
+            await self._load_processed_hashes()
         
-        if not duplicate_file.exists():
-            return False
-        
-        with open(duplicate_file, 'r') as f:
-            processed_hashes = f.read().splitlines()
-        
-        return content_hash in processed_hashes
+        async with self._hash_lock:
+            if content_hash in self._processed_hashes:
+                return False
+            self._processed_hashes.add(content_hash)
+            return True
+
+    async def _load_processed_hashes(self):
+        """Load the processed-hash log into memory without blocking the event loop"""
+        async with self._hash_lock:
+            # Another coroutine may have finished loading while this one waited
+            if self._processed_hashes is not None:
+                return
+            
+            hashes = set()
+            duplicate_file = self.data_dir / "processed_hashes.txt"
+            if duplicate_file.exists():
+                async with aiofiles.open(duplicate_file, 'r') as f:
+                    hashes.update((await f.read()).splitlines())
+            
+            # Published only once complete, so no caller ever sees a partial set
+            self._processed_hashes = hashes
+
+    async def _record_processed_hash(self, content_hash: str):
+        """Append a hash to the processed-hash log via a long-lived handle"""
+        async with self._hash_lock:
+            if self._hash_file is None:
+                self._hash_file = await aiofiles.open(self.data_dir / "processed_hashes.txt", 'a')
+            
+            await self._hash_file.write(f"{content_hash}\n")
+            await self._hash_file.flush()
 
     async def _save_to_rag(self, article: Dict[str, Any]):
-        """Save article to RAG database"""
+        """Queue article for the RAG database, flushing once a batch is full"""
+        self._rag_batch.append(article)
+        
+        if len(self._rag_batch) >= self.rag_batch_size:
+            await self._flush_rag()
+
+    async def _flush_rag(self):
+        """Embed and save all queued articles to the RAG database"""
+        batch, self._rag_batch = self._rag_batch, []
+        if not batch:
+            return
+        
         try:
-            await self.rag_embedder.add_document(
-                content=article['content'],
-                metadata={
-                    'title': article['title'],
-                    'source': article['source'],
-                    'category': article['category'],
-                    'tags': article['tags'],
-                    'security_score': article['security_score'],
-                    'url': article['url']
-                },
-                collection=article['category']
+            await self.rag_embedder.add_documents(
+                contents=[article['content'] for article in batch],
+                metadatas=[
+                    {
+                        'title': article['title'],
+                        'source': article['source'],
+                        'category': article['category'],
+                        'tags': article['tags'],
+                        'security_score': article['security_score'],
+                        'url': article['url']
+                    }
+                    for article in batch
+                ],
+                collections=[article['category'] for article in batch]
             )
         except Exception as e:
-            logger.error(f"Failed to save to RAG: {e}")
+            logger.error(f"Failed to save {len(batch)} articles to RAG: {e}")
 
     async def _save_article_json(self, article: Dict[str, Any]):
         """Save article to JSON file"""
@@ -372,21 +658,48 @@ Tags should include: vulnerability types, affected technologies, attack methods,
             category_dir = self.data_dir / article['category']
             category_dir.mkdir(exist_ok=True)
             
-            # Save article
-            filename = f"{article['id']}_{datetime.now().strftime('%Y%m%d')}.json"
+            # Save article; score and source in the name let the index be
+            # rebuilt from a directory listing alone
+            filename = (
+                f"{article['id']}_{_score_for_filename(article['security_score'])}_"
+                f"{_slugify(article['source'])}_{datetime.now().strftime('%Y%m%d')}.json"
+            )
             filepath = category_dir / filename
             
-            with open(filepath, 'w') as f:
-                json.dump(article, f, indent=2, default=str)
+            async with aiofiles.open(filepath, 'wb') as f:
+                await f.write(JSONHandler.dumps(article, indent=True))
+            
+            # Queue the article index row; committed per feed by _flush_article_index
+            self._index_rows.append(
+                (article['id'], article['source'], article['category'],
+                 article['security_score'], article['processed_at'])
+            )
             
             # Update processed hashes
-            duplicate_file = self.data_dir / "processed_hashes.txt"
-            with open(duplicate_file, 'a') as f:
-                f.write(f"{article['id']}\n")
+            await self._record_processed_hash(article['id'])
                 
         except Exception as e:
             logger.error(f"Failed to save article JSON: {e}")
 
+    async def _flush_article_index(self):
+        """Write queued article index rows in one transaction off the event loop"""
+        rows, self._index_rows = self._index_rows, []
+        if not rows:
+            return
+        
+        def write():
+            self._db.executemany("INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?)", rows)
+            self._db.commit()
+        
+        try:
+            await self.initialize()
+            
+            # The connection is shared, so threads using it take turns
+            async with self._index_lock:
+                await asyncio.to_thread(write)
+        except Exception as e:
+            logger.error(f"Failed to index {len(rows)} articles: {e}")
+
     def _format_highlights(self, highlights: List[Dict[str, Any]]) -> str:
         """Format highlights for display"""
         if not highlights:
@@ -407,6 +720,7 @@ Tags should include: vulnerability types, affected technologies, attack methods,
             for feed_config in feeds:
                 if feed_config['name'] == feed_name:
                     articles = await self._fetch_and_process_feed(feed_config)
+                    await self._flush_rag()
                     return {
                         'feed_name': feed_name,
                         'articles': articles,
@@ -430,42 +744,63 @@ Tags should include: vulnerability types, affected technologies, attack methods,
             }
         }
         
-        # Count articles in each category
-        for category_dir in self.data_dir.iterdir():
-            if category_dir.is_dir() and category_dir.name != 'chroma_db':
-                category_articles = list(category_dir.glob('*.json'))
-                stats['articles_by_category'][category_dir.name] = len(category_articles)
-                stats['total_articles'] += len(category_articles)
-                
-                # Analyze security scores
-                for article_file in category_articles:
-                    try:
-                        with open(article_file, 'r') as f:
-                            article = json.load(f)
-                            score = article.get('security_score', 0)
-                            source = article.get('source', 'unknown')
-                            
-                            # Update source count
-                            stats['articles_by_source'][source] = stats['articles_by_source'].get(source, 0) + 1
-                            
-                            # Update score distribution
-                            if score >= 8:
-                                stats['security_score_distribution']['high'] += 1
-                            elif score >= 5:
-                                stats['security_score_distribution']['medium'] += 1
-                            else:
-                                stats['security_score_distribution']['low'] += 1
-                                
-                    except Exception as e:
-                        logger.error(f"Failed to analyze article {article_file}: {e}")
+        def query():
+            # Count articles in each category
+            for category, count in self._db.execute(
+                "SELECT category, COUNT(*) FROM articles GROUP BY category"
+            ):
+                stats['articles_by_category'][category] = count
+                stats['total_articles'] += count
+            
+            # Count articles per source
+            for source, count in self._db.execute(
+                "SELECT source, COUNT(*) FROM articles GROUP BY source"
+            ):
+                stats['articles_by_source'][source] = count
+            
+            # Security score distribution
+            high, medium, low = self._db.execute(
+                "SELECT "
+                "COALESCE(SUM(CASE WHEN security_score >= 8 THEN 1 ELSE 0 END), 0), "
+                "COALESCE(SUM(CASE WHEN security_score >= 5 AND security_score < 8 THEN 1 ELSE 0 END), 0), "
+                "COALESCE(SUM(CASE WHEN security_score < 5 THEN 1 ELSE 0 END), 0) "
+                "FROM articles"
+            ).fetchone()
+            stats['security_score_distribution'] = {'high': high, 'medium': medium, 'low': low}
+        
+        try:
+            await self.initialize()
+            async with self._index_lock:
+                await asyncio.to_thread(query)
+        except Exception as e:
+            logger.error(f"Failed to query article statistics: {e}")
         
         return stats
 
+    async def close(self):
+        """Flush queued RAG articles and release HTTP, hash log and index handles"""
+        await self._flush_rag()
+        await self._flush_article_index()
+        
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        
+        async with self._hash_lock:
+            if self._hash_file is not None:
+                await self._hash_file.close()
+                self._hash_file = None
+        
+        async with self._index_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
 if __name__ == "__main__":
     # Test the RSS fetcher
     async def test_rss_fetcher():
         with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAMLLoader)
         
         fetcher = RSSFetcher(config)
         
@@ -5,164 +5,205 @@ Coordinates between custom agents, CAI, and PentestGPT
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
-from pathlib import Path
+import functools
+import importlib
+import re
 import sys
+import time
+from typing import Dict, List, Any, Optional
+
+from core.shared_utils import CONFIG, LoggerManager
+from integrations.cai_integration import CAIIntegration
+from integrations.pentestgpt_integration import PentestGPTIntegration
+
+# Task-type labels attached to every routed result
+_PENTEST = sys.intern('penetration_testing')
+_INTEL = sys.intern('intelligence_gathering')
+_ANALYSIS = sys.intern('analysis')
+_GENERAL = sys.intern('general')
 
-# Add integrations to path
-sys.path.append(str(Path(__file__).parent.parent / "integrations"))
-sys.path.append(str(Path(__file__).parent.parent / "agents"))
+# Routing keywords per task category, in priority order
+TASK_KEYWORDS = {
+    'pentest': frozenset({'scan', 'exploit', 'vulnerability', 'pentest', 'hack', 'attack', 'payload'}),
+    'intel': frozenset({'rss', 'news', 'feed', 'cve', 'threat', 'intelligence', 'osint'}),
+    'analysis': frozenset({'analyze', 'file', 'document', 'report', 'parse', 'extract'}),
+}
 
-from shared_utils import ConfigManager, LoggerManager
-from cai_integration import CAIIntegration
-from pentestgpt_integration import PentestGPTIntegration
+# One alternation over every keyword; the named group identifies the category
+TASK_PATTERN = re.compile(
+    '|'.join(
+        f"(?P<{category}>{'|'.join(map(re.escape, sorted(keywords)))})"
+        for category, keywords in TASK_KEYWORDS.items()
+    ),
+    re.IGNORECASE
+)
+
+@functools.lru_cache(maxsize=1024)
+def _classify_task(task_lower: str) -> str:
+    """Classify a lowercased task in one scan over all routing keywords"""
+    found = set()
+    for match in TASK_PATTERN.finditer(task_lower):
+        if match.lastgroup == 'pentest':
+            return 'pentest'
+        found.add(match.lastgroup)
+    
+    for category in ('intel', 'analysis'):
+        if category in found:
+            return category
+    
+    return 'general'
 
 class AgentOrchestrator:
     """Orchestrates between all available AI frameworks and custom agents"""
     
     def __init__(self):
-        self.config = ConfigManager.get_instance().config
+        self.config = CONFIG
         self.logger = LoggerManager.setup_logger('orchestrator')
         
         # Initialize framework integrations
         self.cai = CAIIntegration()
         self.pentestgpt = PentestGPTIntegration()
         
-        # Initialize custom agents
-        self.custom_agents = self._initialize_custom_agents()
+        # Custom agents are imported and constructed on first use
+        self._agent_factories = {
+            'rag': ('agents.rag_embedder', 'RAGEmbedder'),
+            'rss': ('agents.rss_fetcher', 'RSSFetcher'),
+            'file_parser': ('agents.file_parser', 'FileParser'),
+            'report_generator': ('agents.report_generator', 'ReportGenerator'),
+            'pentestgpt_gemini': ('agents.pentestgpt_gemini', 'PentestGPT'),
+        }
+        self._agent_cache = {}
         
         self.logger.info("🎭 Agent Orchestrator initialized")
     
-    def _initialize_custom_agents(self) -> Dict[str, Any]:
-        """Initialize custom agent instances"""
-        agents = {}
-        
-        try:
-            # Import custom agents
-            from rag_embedder import RAGEmbedder
-            from rss_fetcher import RSSFetcher
-            from file_parser import FileParser
-            from report_generator import ReportGenerator
-            from pentestgpt_gemini import PentestGPT
-            
-            agents['rag'] = RAGEmbedder(self.config)
-            agents['rss'] = RSSFetcher(self.config)
-            agents['file_parser'] = FileParser(self.config)
-            agents['report_generator'] = ReportGenerator(self.config)
-            agents['pentestgpt_gemini'] = PentestGPT(self.config)
-            
-            self.logger.info("✅ Custom agents initialized")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize custom agents: {e}")
-            
-        return agents
+    def _get_agent(self, name: str) -> Optional[Any]:
+        """Get a custom agent instance, importing and creating it on first use"""
+        if name not in self._agent_cache:
+            module_name, class_name = self._agent_factories[name]
+            try:
+                module = importlib.import_module(module_name)
+                self._agent_cache[name] = getattr(module, class_name)(self.config)
+                self.logger.info(f"✅ Custom agent '{name}' initialized")
+            except Exception as e:
+                self.logger.error(f"Failed to initialize custom agent '{name}': {e}")
+                self._agent_cache[name] = None
+        
+        return self._agent_cache[name]
+    
+    @functools.cached_property
+    def gemini_agent(self) -> Optional[Any]:
+        """Gemini analysis agent used by most routes"""
+        return self._get_agent('pentestgpt_gemini')
     
     async def route_task(self, task: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Intelligently route tasks to the best-suited agent framework"""
-        task_lower = task.lower()
         context = context or {}
         
         # Determine task type and route accordingly
-        if self._is_penetration_testing_task(task_lower):
-            return await self._route_pentest_task(task, context)
-        elif self._is_intelligence_gathering_task(task_lower):
-            return await self._route_intelligence_task(task, context)
-        elif self._is_analysis_task(task_lower):
-            return await self._route_analysis_task(task, context)
-        else:
-            return await self._route_general_task(task, context)
-    
-    def _is_penetration_testing_task(self, task: str) -> bool:
-        """Check if task is penetration testing related"""
-        pentest_keywords = ['scan', 'exploit', 'vulnerability', 'pentest', 'hack', 'attack', 'payload']
-        return any(keyword in task for keyword in pentest_keywords)
-    
-    def _is_intelligence_gathering_task(self, task: str) -> bool:
-        """Check if task is intelligence gathering related"""
-        intel_keywords = ['rss', 'news', 'feed', 'cve', 'threat', 'intelligence', 'osint']
-        return any(keyword in task for keyword in intel_keywords)
+        routes = {
+            'pentest': self._route_pentest_task,
+            'intel': self._route_intelligence_task,
+            'analysis': self._route_analysis_task,
+            'general': self._route_general_task
+        }
+        # Classification is cached on the normalized task string
+        return await routes[_classify_task(task.lower())](task, context)
     
-    def _is_analysis_task(self, task: str) -> bool:
-        """Check if task is analysis related"""
-        analysis_keywords = ['analyze', 'file', 'document', 'report', 'parse', 'extract']
-        return any(keyword in task for keyword in analysis_keywords)
+    async def _gather_agent_results(self, calls: Dict[str, Any]) -> Dict[str, Any]:
+        """Run independent agent calls concurrently, keyed by result label"""
+        labels = list(calls)
+        gathered = await asyncio.gather(*calls.values(), return_exceptions=True)
+        
+        results = {}
+        for label, value in zip(labels, gathered):
+            if isinstance(value, Exception):
+                self.logger.error(f"{label} failed: {value}")
+                results[label] = {'error': str(value)}
+            else:
+                results[label] = value
+        
+        return results
     
     async def _route_pentest_task(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Route penetration testing tasks"""
-        results = {}
+        calls = {}
         
-        # Try CAI first for tool execution
         if 'target' in context:
+            # CAI for tool execution
             self.logger.info("Routing to CAI for tool execution...")
-            cai_result = await self.cai.run_cai_agent("reconnaissance", task, context)
-            results['cai_execution'] = cai_result
-        
-        # Use PentestGPT for strategic reasoning
-        if 'target' in context:
+            calls['cai_execution'] = self.cai.run_cai_agent("reconnaissance", task, context)
+            
+            # PentestGPT for strategic reasoning
             self.logger.info("Routing to PentestGPT for strategic analysis...")
-            pentestgpt_result = await self.pentestgpt.run_pentestgpt_session(context['target'])
-            results['pentestgpt_analysis'] = pentestgpt_result
+            calls['pentestgpt_analysis'] = self.pentestgpt.run_pentestgpt_session(context['target'])
         
         # Use custom PentestGPT Gemini for additional insights
-        if 'pentestgpt_gemini' in self.custom_agents:
+        if (gemini_agent := self.gemini_agent) is not None:
             self.logger.info("Adding Gemini-based analysis...")
-            gemini_result = await self.custom_agents['pentestgpt_gemini'].analyze_security_scenario(task)
-            results['gemini_insights'] = gemini_result
+            calls['gemini_insights'] = gemini_agent.analyze_security_scenario(task)
         
-        return self._combine_results(results, 'penetration_testing')
+        results = await self._gather_agent_results(calls)
+        return self._combine_results(results, _PENTEST)
     
     async def _route_intelligence_task(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Route intelligence gathering tasks"""
-        results = {}
+        calls = {}
         
         # Use RSS fetcher for threat intelligence
-        if 'rss' in self.custom_agents:
+        rss_agent = self._get_agent('rss')
+        if rss_agent:
             self.logger.info("Gathering RSS intelligence...")
-            rss_result = await self.custom_agents['rss'].fetch_and_process_feeds()
-            results['rss_intelligence'] = rss_result
+            calls['rss_intelligence'] = rss_agent.fetch_and_process_feeds()
         
         # Use RAG for knowledge base queries
-        if 'rag' in self.custom_agents and 'query' in context:
+        rag_agent = self._get_agent('rag') if 'query' in context else None
+        if rag_agent:
             self.logger.info("Querying knowledge base...")
-            rag_result = await self.custom_agents['rag'].search_knowledge_base(context['query'])
-            results['knowledge_base'] = rag_result
+            calls['knowledge_base'] = rag_agent.search_knowledge_base(context['query'])
         
-        return self._combine_results(results, 'intelligence_gathering')
+        results = await self._gather_agent_results(calls)
+        return self._combine_results(results, _INTEL)
     
     async def _route_analysis_task(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Route analysis tasks"""
-        results = {}
+        calls = {}
         
         # Use file parser for document analysis
-        if 'file_parser' in self.custom_agents and 'file_path' in context:
+        file_parser = self._get_agent('file_parser') if 'file_path' in context else None
+        if file_parser:
             self.logger.info("Analyzing file...")
-            file_result = await self.custom_agents['file_parser'].parse_file(context['file_path'])
-            results['file_analysis'] = file_result
+            calls['file_analysis'] = file_parser.parse_file(context['file_path'])
         
         # Use report generator for report creation
-        if 'report' in task.lower() and 'report_generator' in self.custom_agents:
+        report_generator = self._get_agent('report_generator') if 'report' in task.lower() else None
+        if report_generator:
             self.logger.info("Generating report...")
-            report_result = await self.custom_agents['report_generator'].generate_report()
-            results['report'] = report_result
+            calls['report'] = report_generator.generate_report()
         
-        return self._combine_results(results, 'analysis')
+        results = await self._gather_agent_results(calls)
+        return self._combine_results(results, _ANALYSIS)
     
     async def _route_general_task(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Route general tasks"""
         # Default to Gemini-based analysis
-        if 'pentestgpt_gemini' in self.custom_agents:
+        if (gemini_agent := self.gemini_agent) is not None:
             self.logger.info("Using Gemini for general analysis...")
-            result = await self.custom_agents['pentestgpt_gemini'].analyze_security_scenario(task)
-            return {'general_analysis': result, 'task_type': 'general'}
+            result = await gemini_agent.analyze_security_scenario(task)
+            return {'general_analysis': result, 'task_type': _GENERAL}
         
         return {'error': 'No suitable agent available for general task'}
     
     def _combine_results(self, results: Dict[str, Any], task_type: str) -> Dict[str, Any]:
         """Combine results from multiple agents"""
+        # A single agent's dict result is returned as a tagged copy; the agent's own dict is left untouched
+        if len(results) == 1:
+            result = next(iter(results.values()))
+            if isinstance(result, dict):
+                return {**result, 'task_type': task_type}
+        
         return {
             'task_type': task_type,
-            'timestamp': asyncio.get_event_loop().time(),
+            'timestamp': time.monotonic(),
             'results': results,
             'summary': f"Combined results from {len(results)} agents"
         }
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+LLM Request Batcher
+Coalesces concurrent prompts into batched LLM calls
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Set, Tuple
+from loguru import logger
+
+# Receives the prompts of one batch and returns one response (or exception) per prompt
+BatchHandler = Callable[[List[str]], Awaitable[List[Any]]]
+
+class LLMBatcher:
+    """Request buffer flushed to the LLM every interval or when full"""
+    
+    def __init__(self, batch_handler: BatchHandler, max_batch_size: int = 8, flush_interval: float = 0.05):
+        self.batch_handler = batch_handler
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        
+        self._buffer: List[Tuple[str, asyncio.Future]] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._full = asyncio.Event()
+        self._collector: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._closing = False
+    
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called"""
+        return self._closing
+    
+    def _spawn(self, coro: Coroutine) -> asyncio.Task:
+        """Run a coroutine as a task tracked until it finishes"""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+    
+    async def submit(self, prompt: str) -> str:
+        """Queue a prompt and wait for its response, sharing any identical prompt already pending"""
+        if self._closing:
+            raise RuntimeError("LLM batcher is closed")
+        
+        future = self._inflight.get(prompt)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[prompt] = future
+            future.add_done_callback(lambda _, prompt=prompt: self._inflight.pop(prompt, None))
+            
+            self._buffer.append((prompt, future))
+            if len(self._buffer) >= self.max_batch_size:
+                self._full.set()
+            if self._collector is None:
+                self._collector = self._spawn(self._collect())
+        
+        # One caller giving up must not cancel the response others are waiting for
+        return await asyncio.shield(future)
+    
+    async def _collect(self):
+        """Gather one batch, then send it without waiting for batches already in flight"""
+        # A lone prompt goes out at once; a backlog waits briefly for company
+        if len(self._buffer) > 1 and not self._closing:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+        
+        # Prompts submitted from here on start the next batch
+        self._collector = None
+        await self.flush()
+    
+    async def flush(self):
+        """Send every buffered prompt to the batch handler and resolve their futures"""
+        batch, self._buffer = self._buffer, []
+        self._full.clear()
+        
+        if not batch:
+            return
+        
+        prompts = [prompt for prompt, _ in batch]
+        
+        try:
+            responses = await self.batch_handler(prompts)
+        except Exception as e:
+            logger.error(f"❌ LLM batch of {len(prompts)} prompts failed: {e}")
+            responses = [e] * len(prompts)
+        except asyncio.CancelledError:
+            # Callers of an interrupted batch must not wait forever
+            for _, future in batch:
+                future.cancel()
+            raise
+        
+        for (_, future), response in zip(batch, responses):
+            if future.done():
+                continue
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+        
+        logger.debug(f"📦 Flushed LLM batch of {len(batch)} prompts")
+    
+    async def close(self):
+        """Send buffered prompts and wait for every batch in flight"""
+        self._closing = True
+        self._full.set()
+        
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        
+        await self.flush()
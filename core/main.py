@@ -5,16 +5,19 @@ Orchestrates all components for the intelligent pentesting assistant
 """
 
 import asyncio
+import gc
 import signal
 import sys
 import os
-import time
 import psutil
 from pathlib import Path
-from typing import Dict, Any
-import yaml
+from typing import Dict
 from loguru import logger
-from dotenv import load_dotenv
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
@@ -27,8 +30,8 @@ from agents.rss_fetcher import RSSFetcher
 from agents.pentestgpt_gemini import PentestGPTGemini
 from agents.rag_embedder import RAGEmbedder
 from core.shared_utils import (
-    ConfigManager, LoggerManager, DirectoryManager,
-    EnvironmentValidator, initialize_shared_components
+    CONFIG, LoggerManager, DirectoryManager,
+    EnvironmentValidator, SystemMetrics, initialize_shared_components
 )
 
 class CyberAgentPlatform:
@@ -38,14 +41,8 @@ class CyberAgentPlatform:
         self.is_running = False
         self.components = {}
         
-        # Initialize shared components first
-        if not initialize_shared_components():
-            logger.error("❌ Failed to initialize shared components!")
-            sys.exit(1)
-        
-        # Use shared configuration manager
-        self.config_manager = ConfigManager()
-        self.config = self.config_manager.config
+        # Use shared configuration
+        self.config = CONFIG
         
         # Setup logging using shared utility
         LoggerManager.setup_logger('main')
@@ -58,27 +55,20 @@ class CyberAgentPlatform:
         
         logger.info("🚀 Cybersecurity AI Agent Platform initialized with shared utilities")
         
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration"""
-        load_dotenv()
-        try:
-            with open('config.yaml', 'r') as f:
-                return yaml.safe_load(f)
-        except FileNotFoundError:
-            logger.error("❌ config.yaml not found!")
-            sys.exit(1)
-    
     def _setup_logging(self):
         """Setup comprehensive logging"""
-        log_dir = Path("logs/main")
-        log_dir.mkdir(parents=True, exist_ok=True)
+        Path("logs/main").mkdir(parents=True, exist_ok=True)
         
+        # Loguru renders the dated filename and swaps files at midnight;
+        # enqueue hands record writes to a background thread
         logger.add(
-            log_dir / f"platform_{time.strftime('%Y-%m-%d')}.log",
-            rotation="1 day",
+            "logs/main/platform_{time:YYYY-MM-DD}.log",
+            rotation="00:00",
             retention="30 days",
+            enqueue=True,
+            buffering=LoggerManager.BUFFER_SIZE,
             level="INFO",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
+            format="{time} | {level} | {name}:{function}:{line} | {message}"
         )
         
         logger.info("🚀 Cybersecurity AI Agent Platform Starting...")
@@ -90,7 +80,7 @@ class CyberAgentPlatform:
         # Check memory
         memory = psutil.virtual_memory()
         memory_gb = memory.total / (1024**3)
-        logger.info(f"💾 System Memory: {memory_gb:.1f}GB")
+        logger.opt(lazy=True).info("💾 System Memory: {:.1f}GB", lambda: memory_gb)
         
         if memory_gb < 7:
             logger.warning("⚠️  Low memory detected! Consider reducing batch sizes.")
@@ -98,19 +88,14 @@ class CyberAgentPlatform:
         # Check disk space
         disk = psutil.disk_usage('.')
         disk_gb = disk.free / (1024**3)
-        logger.info(f"💽 Available Disk: {disk_gb:.1f}GB")
+        logger.opt(lazy=True).info("💽 Available Disk: {:.1f}GB", lambda: disk_gb)
         
         if disk_gb < 5:
             logger.warning("⚠️  Low disk space! Enable log cleanup.")
         
         # Check required environment variables
-        required_vars = [
-            'TELEGRAM_BOT_TOKEN',
-            'AUTHORIZED_USER_ID',
-            'GEMINI_API_KEY'
-        ]
-        
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
+        env = os.environ
+        missing_vars = [var for var in EnvironmentValidator.REQUIRED_VARS if not env.get(var)]
         if missing_vars:
             logger.error(f"❌ Missing environment variables: {missing_vars}")
             logger.error("Please check your .env file")
@@ -123,17 +108,18 @@ class CyberAgentPlatform:
         logger.info("🔧 Initializing components...")
         
         try:
-            # Initialize core components
-            self.components['rag_embedder'] = RAGEmbedder(self.config)
-            await self.components['rag_embedder'].initialize()
-            logger.info("✅ RAG Embedder initialized")
+            loop = asyncio.get_running_loop()
+            
+            # Model-loading constructors run in worker threads alongside the rest
+            threaded = {
+                'rag_embedder': loop.run_in_executor(None, RAGEmbedder, self.config),
+                'task_router': loop.run_in_executor(None, TaskRouter, self.config),
+            }
             
+            # These create asyncio primitives, so they are built on the loop thread
             self.components['pentestgpt'] = PentestGPTGemini(self.config)
             logger.info("✅ PentestGPT initialized")
             
-            self.components['task_router'] = TaskRouter(self.config)
-            logger.info("✅ Task Router initialized")
-            
             self.components['rss_fetcher'] = RSSFetcher(self.config)
             logger.info("✅ RSS Fetcher initialized")
             
@@ -141,6 +127,16 @@ class CyberAgentPlatform:
             self.components['telegram_bot'] = CybersecurityBot()
             logger.info("✅ Telegram Bot initialized")
             
+            for name, component in zip(threaded, await asyncio.gather(*threaded.values())):
+                self.components[name] = component
+                logger.info(f"✅ {name} initialized")
+            
+            # Independent async warmups run together
+            await asyncio.gather(*(
+                component.initialize() for component in self.components.values()
+                if asyncio.iscoroutinefunction(getattr(component, 'initialize', None))
+            ))
+            
             logger.info("🎉 All components initialized successfully!")
             
         except Exception as e:
@@ -151,73 +147,92 @@ class CyberAgentPlatform:
         """Start background automation tasks"""
         logger.info("🔄 Starting background tasks...")
         
-        tasks = []
+        # Periodic jobs as [interval_seconds, job, next_run]; all are due on startup
+        now = asyncio.get_running_loop().time()
+        self._jobs = []
         
         # RSS Feed Monitoring
         if self.config.get('automation', {}).get('rss_enabled', True):
-            tasks.append(asyncio.create_task(self._rss_monitor()))
-            logger.info("📡 RSS monitoring started")
+            rss_interval = int(os.getenv('RSS_FETCH_INTERVAL', 21600))  # 6 hours
+            self._jobs.append([rss_interval, self._fetch_rss_feeds, now])
+            logger.info("📡 RSS monitoring scheduled")
         
         # System Health Monitoring
-        tasks.append(asyncio.create_task(self._health_monitor()))
-        logger.info("🏥 Health monitoring started")
+        self._jobs.append([3600, self._check_health, now])  # Check every hour
+        logger.info("🏥 Health monitoring scheduled")
         
         # Memory cleanup task
-        tasks.append(asyncio.create_task(self._memory_cleanup()))
-        logger.info("🧹 Memory cleanup task started")
+        self._jobs.append([1800, self._cleanup_memory, now])  # Every 30 minutes
+        logger.info("🧹 Memory cleanup scheduled")
         
-        return tasks
+        return [asyncio.create_task(self._run_scheduler())]
     
-    async def _rss_monitor(self):
-        """Background RSS feed monitoring"""
-        rss_interval = int(os.getenv('RSS_FETCH_INTERVAL', 21600))  # 6 hours
+    async def _run_scheduler(self):
+        """Single loop that runs each periodic job when it falls due"""
+        loop = asyncio.get_running_loop()
         
-        while self.is_running:
-            try:
-                logger.info("📡 Starting RSS feed fetch...")
-                await self.components['rss_fetcher'].fetch_all_feeds()
-                logger.info("✅ RSS feeds processed successfully")
-            except Exception as e:
-                logger.error(f"❌ RSS fetch error: {e}")
-            
-            await asyncio.sleep(rss_interval)
-    
-    async def _health_monitor(self):
-        """Monitor system health using shared utilities"""
-        while self.is_running:
-            try:
-                # Use shared system metrics
-                from shared_utils import SystemMetrics
-                metrics = SystemMetrics.get_system_metrics()
-                
-                memory_percent = metrics['memory_percent']
-                disk_percent = metrics['disk_percent']
-                
-                if memory_percent > 85:
-                    logger.warning(f"⚠️  High memory usage: {memory_percent}%")
-                
-                if disk_percent > 90:
-                    logger.warning(f"⚠️  High disk usage: {disk_percent}%")
+        # At most one running task per job; a slow job never delays the others
+        in_flight: Dict[int, asyncio.Task] = {}
+        
+        try:
+            while self.is_running:
+                now = loop.time()
                 
-                # Log health status every hour
-                logger.info(f"💊 System Health - Memory: {memory_percent}%, Disk: {disk_percent}%")
+                for index, job in enumerate(self._jobs):
+                    if job[2] > now:
+                        continue
+                    job[2] = now + job[0]
+                    
+                    # Skip this slot if the previous run is still going
+                    task = in_flight.get(index)
+                    if task is None or task.done():
+                        in_flight[index] = asyncio.create_task(job[1]())
                 
-            except Exception as e:
-                logger.error(f"❌ Health monitor error: {e}")
+                await asyncio.sleep(max(0, min(job[2] for job in self._jobs) - loop.time()))
+        finally:
+            for task in in_flight.values():
+                task.cancel()
+    
+    async def _fetch_rss_feeds(self):
+        """Background RSS feed fetch"""
+        try:
+            logger.info("📡 Starting RSS feed fetch...")
+            await self.components['rss_fetcher'].fetch_all_feeds()
+            logger.info("✅ RSS feeds processed successfully")
+        except Exception as e:
+            logger.error(f"❌ RSS fetch error: {e}")
+    
+    async def _check_health(self):
+        """Check system health using shared utilities"""
+        try:
+            # Use shared system metrics
+            metrics = await SystemMetrics.get_system_metrics_async()
+            
+            memory_percent = metrics['memory']['percent']
+            disk_percent = metrics['disk']['percent']
+            
+            if memory_percent > 85:
+                logger.warning(f"⚠️  High memory usage: {memory_percent}%")
+            
+            if disk_percent > 90:
+                logger.warning(f"⚠️  High disk usage: {disk_percent}%")
             
-            await asyncio.sleep(3600)  # Check every hour
+            # Log health status every hour
+            logger.opt(lazy=True).info(
+                "💊 System Health - Memory: {}%, Disk: {}%",
+                lambda: memory_percent, lambda: disk_percent
+            )
+            
+        except Exception as e:
+            logger.error(f"❌ Health monitor error: {e}")
     
-    async def _memory_cleanup(self):
+    async def _cleanup_memory(self):
         """Periodic memory cleanup"""
-        while self.is_running:
-            try:
-                import gc
-                gc.collect()
-                logger.debug("🧹 Memory cleanup performed")
-            except Exception as e:
-                logger.error(f"❌ Memory cleanup error: {e}")
-            
-            await asyncio.sleep(1800)  # Every 30 minutes
+        try:
+            gc.collect()
+            logger.debug("🧹 Memory cleanup performed")
+        except Exception as e:
+            logger.error(f"❌ Memory cleanup error: {e}")
     
     def setup_signal_handlers(self):
         """Setup graceful shutdown handlers"""
@@ -234,6 +249,11 @@ class CyberAgentPlatform:
         self.setup_signal_handlers()
         
         try:
+            # Initialize shared components first
+            if not await initialize_shared_components():
+                logger.error("❌ Failed to initialize shared components!")
+                sys.exit(1)
+            
             # Initialize all components
             await self.initialize_components()
             
@@ -277,6 +297,12 @@ class CyberAgentPlatform:
         
         logger.info("👋 Platform shutdown complete")
 
+def install_event_loop_policy():
+    """Run the platform on uvloop's libuv event loop when it is installed"""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("⚡ uvloop event loop enabled")
+
 async def main():
     """Entry point"""
     try:
@@ -301,4 +327,5 @@ if __name__ == "__main__":
 🧠 Powered by Gemini API
     """)
     
+    install_event_loop_policy()
     asyncio.run(main())
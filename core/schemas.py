@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Response Schemas
+Typed results passed from agents to the Telegram handlers
+"""
+
+import msgspec
+
+class ScanResult(msgspec.Struct, kw_only=True):
+    """Outcome of TaskRouter.route_scan_task, in saved-report field order"""
+    target: str
+    scan_type: str = 'comprehensive'
+    status: str = 'completed'
+    summary: str
+    findings: str
+    recommendations: str
+    timestamp: str
+    analysis_id: str = ''
@@ -5,39 +5,134 @@ Common functions and classes used across multiple modules
 """
 
 import asyncio
+import copy
+import functools
+import hashlib
 import json
+import mmap
 import os
+import string
+import sys
 import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Union
 import yaml
 from loguru import logger
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# libyaml's C parser when available, pure-Python otherwise
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+# Environment variables with real (non-placeholder) values, refreshed after .env is loaded
+_VALID_ENV: Dict[str, str] = {}
+
+def refresh_env() -> Dict[str, str]:
+    """Re-snapshot configured environment variables"""
+    global _VALID_ENV
+    _VALID_ENV = {k: v for k, v in os.environ.items() if v and not v.startswith('your_')}
+    return _VALID_ENV
+
+# [epoch second, formatted string] so bursts within one second share a single strftime
+_ts_cache: List[Any] = [0, '']
+
+def now_str() -> str:
+    """Current local time as 'YYYY-MM-DD HH:MM:SS', formatted at most once per second"""
+    t = int(time.time())
+    c = _ts_cache
+    if c[0] != t:
+        c[1] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(t))
+        c[0] = t
+    return c[1]
+
 class ConfigManager:
     """Centralized configuration management"""
     
     _instance = None
     _config = None
+    _flat = {}
+    
+    # Parsed YAML files keyed by path: (mtime_ns, size, content), least recently used first
+    _yaml_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+    _YAML_CACHE_SIZE = 100
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            cls._instance = cls._build()
         return cls._instance
     
-    def __init__(self):
-        if self._config is None:
-            self.load_config()
+    @classmethod
+    def _build(cls) -> 'ConfigManager':
+        """Create and load the shared instance; later calls reuse it without re-initializing"""
+        instance = super().__new__(cls)
+        instance.load_config()
+        return instance
+    
+    @classmethod
+    def get_instance(cls) -> 'ConfigManager':
+        """Get the shared configuration manager instance"""
+        return cls._instance if cls._instance is not None else cls()
+    
+    @classmethod
+    def invalidate(cls) -> Dict[str, Any]:
+        """Reparse config.yaml and refresh the shared CONFIG dict in place for running components"""
+        cls._yaml_cache.clear()
+        try:
+            cls._config_cache_path(Path(__file__).parent / 'config.yaml').unlink()
+        except FileNotFoundError:
+            pass
+        
+        cls._instance = None
+        instance = cls.get_instance()
+        
+        # Components keep references to CONFIG, so update that dict rather than rebinding it
+        if instance._config is not CONFIG:
+            CONFIG.clear()
+            CONFIG.update(instance._config)
+            instance._config = CONFIG
+        
+        # Values derived from the old config
+        _build_gen_config.cache_clear()
+        if GeminiClient._instance is not None and GeminiClient._instance.is_available:
+            GeminiClient._instance._load_generation_defaults()
+        
+        return CONFIG
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from files"""
         load_dotenv()
+        refresh_env()
         
         try:
             config_path = Path(__file__).parent / 'config.yaml'
-            with open(config_path, 'r') as f:
-                self._config = yaml.safe_load(f)
+            stat = config_path.stat()
+            
+            self._config = self._load_config_cache(config_path, stat)
+            if self._config is None:
+                self._config = self._load_yaml_cached(config_path)
+                self._write_config_cache(config_path, stat, self._config)
+            
+            self._flat = self._flatten(self._config)
             logger.info("✅ Configuration loaded successfully")
         except FileNotFoundError:
             logger.error("❌ config.yaml not found!")
@@ -48,23 +143,92 @@ class ConfigManager:
         
         return self._config
     
+    @classmethod
+    def _load_yaml_cached(cls, path: Union[str, Path]) -> Any:
+        """Parse a YAML file, reusing the previous parse while its mtime and size are unchanged"""
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        
+        cached = cls._yaml_cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            cls._yaml_cache.move_to_end(key)
+            # Callers may mutate the result, so hand out a copy
+            return copy.deepcopy(cached[2])
+        
+        # One read, then libyaml parses straight from the bytes buffer
+        with open(key, 'rb') as f:
+            data = f.read()
+        content = yaml.load(data, Loader=YAMLLoader)
+        
+        cls._yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, content)
+        cls._yaml_cache.move_to_end(key)
+        if len(cls._yaml_cache) > cls._YAML_CACHE_SIZE:
+            cls._yaml_cache.popitem(last=False)
+        
+        return copy.deepcopy(content)
+    
+    @staticmethod
+    def _config_cache_path(config_path: Path) -> Path:
+        """JSON sidecar holding the last parsed config"""
+        return config_path.with_name(config_path.name + '.cache.json')
+    
+    def _load_config_cache(self, config_path: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return the cached config if it was parsed from the current config.yaml"""
+        try:
+            cache = JSONHandler.loads(self._config_cache_path(config_path).read_bytes())
+        except Exception:
+            return None
+        
+        if cache.get('_src_mtime') != stat.st_mtime_ns or cache.get('_src_size') != stat.st_size:
+            return None
+        
+        return cache.get('config')
+    
+    def _write_config_cache(self, config_path: Path, stat: os.stat_result, config: Dict[str, Any]) -> None:
+        """Atomically write the parsed config to its JSON sidecar"""
+        cache = {'_src_mtime': stat.st_mtime_ns, '_src_size': stat.st_size, 'config': config}
+        
+        try:
+            data = JSONHandler.dumps(cache)
+            # Only cache configs that survive a JSON round trip unchanged
+            if JSONHandler.loads(data) != cache:
+                return
+            
+            cache_path = self._config_cache_path(config_path)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Config cache not written: {e}")
+    
     @property
     def config(self) -> Dict[str, Any]:
         """Get configuration dictionary"""
         return self._config
     
+    @staticmethod
+    def _flatten(config: Any) -> Dict[str, Any]:
+        """Map every reachable dotted path (leaves and sections) to its value"""
+        flat = {}
+        stack = [('', config)]
+        
+        while stack:
+            prefix, node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            for k, value in node.items():
+                # Only string keys without dots are addressable with dot notation
+                if not isinstance(k, str) or '.' in k:
+                    continue
+                path = f"{prefix}{k}"
+                flat[path] = value
+                stack.append((f"{path}.", value))
+        
+        return flat
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value with dot notation support"""
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def get_api_key(self, service: str) -> Optional[str]:
         """Get API key for a service"""
@@ -78,55 +242,77 @@ class ConfigManager:
         if not env_var:
             return None
         
-        key = os.getenv(env_var)
-        return key if key and not key.startswith('your_') else None
+        return _VALID_ENV.get(env_var)
 
 class LoggerManager:
     """Centralized logging setup and management"""
     
     _initialized_loggers = set()
     
+    # File sinks write from loguru's background thread through a buffer of this size
+    BUFFER_SIZE = 65536
+    
     @classmethod
     def setup_logger(cls, component: str, level: str = "INFO") -> None:
         """Setup logger for a component"""
         if component in cls._initialized_loggers:
             return
         
-        log_dir = Path(f"logs/{component}")
-        log_dir.mkdir(parents=True, exist_ok=True)
+        log_dir = os.path.join('logs', component)
+        os.makedirs(log_dir, exist_ok=True)
         
+        # Loguru renders the date when it opens or rotates the file;
+        # enqueue moves the buffered writes off the calling thread
         logger.add(
-            log_dir / f"{component}_{datetime.now().strftime('%Y-%m-%d')}.log",
+            os.path.join(log_dir, f"{component}_{{time:YYYY-MM-DD}}.log"),
             rotation="1 day",
             retention="30 days",
             level=level,
+            enqueue=True,
+            buffering=cls.BUFFER_SIZE,
             format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
         )
         
         cls._initialized_loggers.add(component)
         logger.info(f"📝 Logger initialized for {component}")
 
+@functools.lru_cache(maxsize=32)
+def _build_gen_config(temperature: float, max_tokens: int, top_p: float) -> Any:
+    """Build (and reuse) a Gemini GenerationConfig for one parameter combination"""
+    import google.generativeai as genai
+    
+    return genai.types.GenerationConfig(
+        temperature=temperature,
+        max_output_tokens=max_tokens,
+        top_p=top_p
+    )
+
 class GeminiClient:
     """Shared Gemini API client with connection management"""
     
     _instance = None
     _model = None
     _api_key = None
+    _gen_defaults = None
+    _default_gen = None
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            cls._instance = cls._build()
         return cls._instance
     
-    def __init__(self):
-        if self._model is None:
-            self._initialize()
+    @classmethod
+    def _build(cls) -> 'GeminiClient':
+        """Create and initialize the shared instance once"""
+        instance = super().__new__(cls)
+        instance._initialize()
+        return instance
     
     def _initialize(self):
         """Initialize Gemini client"""
-        self._api_key = os.getenv('GEMINI_API_KEY')
+        self._api_key = _VALID_ENV.get('GEMINI_API_KEY')
         
-        if not self._api_key or self._api_key.startswith('your_'):
+        if not self._api_key:
             logger.warning("⚠️ Gemini API key not configured")
             return
         
@@ -134,11 +320,24 @@ class GeminiClient:
             import google.generativeai as genai
             genai.configure(api_key=self._api_key)
             self._model = genai.GenerativeModel('gemini-pro')
+            
+            self._load_generation_defaults()
+            
             logger.info("✅ Gemini client initialized")
         except Exception as e:
             logger.error(f"❌ Failed to initialize Gemini client: {e}")
             raise
     
+    def _load_generation_defaults(self):
+        """Read and build default generation settings (again after a config reload)"""
+        model_config = CONFIG.get('models', {}).get('gemini', {})
+        self._gen_defaults = (
+            model_config.get('temperature', 0.7),
+            model_config.get('max_tokens', 4096),
+            model_config.get('top_p', 0.9)
+        )
+        self._default_gen = _build_gen_config(*self._gen_defaults)
+    
     @property
     def is_available(self) -> bool:
         """Check if Gemini API is available"""
@@ -150,23 +349,20 @@ class GeminiClient:
             raise ValueError("Gemini API not available")
         
         try:
-            # Get configuration
-            config_manager = ConfigManager()
-            model_config = config_manager.get('models.gemini', {})
-            
-            generation_config = {
-                'temperature': kwargs.get('temperature', model_config.get('temperature', 0.7)),
-                'max_output_tokens': kwargs.get('max_tokens', model_config.get('max_tokens', 4096)),
-                'top_p': kwargs.get('top_p', model_config.get('top_p', 0.9))
-            }
-            
-            # Import here to avoid circular imports
-            import google.generativeai as genai
+            if kwargs:
+                temperature, max_tokens, top_p = self._gen_defaults
+                generation_config = _build_gen_config(
+                    kwargs.get('temperature', temperature),
+                    kwargs.get('max_tokens', max_tokens),
+                    kwargs.get('top_p', top_p)
+                )
+            else:
+                generation_config = self._default_gen
             
             response = await asyncio.to_thread(
                 self._model.generate_content,
                 prompt,
-                generation_config=genai.types.GenerationConfig(**generation_config)
+                generation_config=generation_config
             )
             
             return response.text
@@ -204,7 +400,7 @@ class GeminiClient:
 class DirectoryManager:
     """Shared directory creation and management"""
     
-    REQUIRED_DIRS = [
+    REQUIRED_DIRS = (
         'logs',
         'rag_data',
         'reports',
@@ -214,30 +410,34 @@ class DirectoryManager:
         'temp',
         'monitoring',
         'backup'
-    ]
-    
-    SUBDIRS = {
-        'logs': ['main', 'pentestgpt', 'telegram', 'rss', 'finetune', 'file_parser', 'rag', 'reports', 'local_llm', 'testing', 'health', 'integration'],
-        'rag_data': ['recon', 'web', 'network', 'exploit', 'reports', 'raw', 'processed', 'chroma_db'],
-        'reports': ['daily', 'weekly', 'custom', 'automated'],
-        'finetune_data': ['raw', 'processed', 'checkpoints'],
-        'models': ['embeddings', 'lora', 'local'],
-        'config': ['prompts', 'feeds', 'templates'],
-        'temp': ['uploads', 'processing'],
-        'monitoring': ['health', 'performance'],
-        'backup': ['daily', 'weekly']
-    }
+    )
+    
+    SUBDIRS = MappingProxyType({
+        'logs': ('main', 'pentestgpt', 'telegram', 'rss', 'finetune', 'file_parser', 'rag', 'reports', 'local_llm', 'testing', 'health', 'integration'),
+        'rag_data': ('recon', 'web', 'network', 'exploit', 'reports', 'raw', 'processed', 'chroma_db'),
+        'reports': ('daily', 'weekly', 'custom', 'automated'),
+        'finetune_data': ('raw', 'processed', 'checkpoints'),
+        'models': ('embeddings', 'lora', 'local'),
+        'config': ('prompts', 'feeds', 'templates'),
+        'temp': ('uploads', 'processing'),
+        'monitoring': ('health', 'performance'),
+        'backup': ('daily', 'weekly')
+    })
+    
+    # Every required directory and subdirectory as a flat path list
+    _ALL_DIRS = REQUIRED_DIRS + tuple(
+        os.path.join(main_dir, subdir)
+        for main_dir, subdirs in SUBDIRS.items()
+        for subdir in subdirs
+    )
     
     @classmethod
     def create_all_directories(cls) -> None:
         """Create all required directories"""
-        for main_dir in cls.REQUIRED_DIRS:
-            Path(main_dir).mkdir(exist_ok=True)
-            
-            # Create subdirectories
-            if main_dir in cls.SUBDIRS:
-                for subdir in cls.SUBDIRS[main_dir]:
-                    Path(main_dir, subdir).mkdir(parents=True, exist_ok=True)
+        for path in cls._ALL_DIRS:
+            # Existing directories only cost one stat
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
         
         logger.info("✅ All directories created")
     
@@ -251,18 +451,21 @@ class DirectoryManager:
 class EnvironmentValidator:
     """Environment validation utilities"""
     
-    REQUIRED_VARS = [
+    REQUIRED_VARS = (
         'TELEGRAM_BOT_TOKEN',
         'AUTHORIZED_USER_ID',
         'GEMINI_API_KEY'
-    ]
+    )
     
-    OPTIONAL_VARS = [
+    # Required variables whose absence fails validation outright
+    CRITICAL_VARS = frozenset({'TELEGRAM_BOT_TOKEN', 'GEMINI_API_KEY'})
+    
+    OPTIONAL_VARS = (
         'AZURE_OPENAI_API_KEY',
         'AZURE_OPENAI_ENDPOINT',
         'WEBHOOK_URL',
         'WEBHOOK_SECRET'
-    ]
+    )
     
     @classmethod
     def validate_environment(cls) -> Dict[str, Any]:
@@ -276,18 +479,16 @@ class EnvironmentValidator:
         
         # Check required variables
         for var in cls.REQUIRED_VARS:
-            value = os.getenv(var)
-            if value and not value.startswith('your_'):
+            if var in _VALID_ENV:
                 results['configured'].append(var)
             else:
                 results['missing'].append(var)
-                if var in ['TELEGRAM_BOT_TOKEN', 'GEMINI_API_KEY']:
+                if var in cls.CRITICAL_VARS:
                     results['status'] = 'fail'
         
         # Check optional variables
         for var in cls.OPTIONAL_VARS:
-            value = os.getenv(var)
-            if value and not value.startswith('your_'):
+            if var in _VALID_ENV:
                 results['configured'].append(var)
             else:
                 results['warnings'].append(f"{var} not configured (optional)")
@@ -297,7 +498,7 @@ class EnvironmentValidator:
     @classmethod
     def check_api_keys(cls) -> Dict[str, bool]:
         """Check which API keys are configured"""
-        config_manager = ConfigManager()
+        config_manager = ConfigManager.get_instance()
         
         return {
             'telegram': bool(config_manager.get_api_key('telegram')),
@@ -308,30 +509,32 @@ class EnvironmentValidator:
 class FileHandler:
     """Shared file handling utilities"""
     
-    SUPPORTED_FORMATS = ['.pdf', '.txt', '.md', '.html', '.json', '.xml', '.csv']
+    SUPPORTED_FORMATS = frozenset({'.pdf', '.txt', '.md', '.html', '.json', '.xml', '.csv'})
     
     @classmethod
     def is_supported_format(cls, file_path: Union[str, Path]) -> bool:
         """Check if file format is supported"""
-        return Path(file_path).suffix.lower() in cls.SUPPORTED_FORMATS
+        return os.path.splitext(file_path)[1].lower() in cls.SUPPORTED_FORMATS
     
     @classmethod
     def get_file_info(cls, file_path: Union[str, Path]) -> Dict[str, Any]:
         """Get file information"""
-        path = Path(file_path)
+        file_path = os.fspath(file_path)
         
-        if not path.exists():
+        try:
+            stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             return {'error': 'File not found'}
         
-        stat = path.stat()
+        extension = os.path.splitext(file_path)[1].lower()
         
         return {
-            'name': path.name,
+            'name': os.path.basename(file_path),
             'size': stat.st_size,
             'size_mb': round(stat.st_size / (1024 * 1024), 2),
-            'extension': path.suffix.lower(),
+            'extension': extension,
             'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            'supported': cls.is_supported_format(path)
+            'supported': extension in cls.SUPPORTED_FORMATS
         }
     
     @classmethod
@@ -358,59 +561,173 @@ class FileHandler:
             validation['warnings'].append(f"File format {info['extension']} may not be fully supported")
         
         return {**info, **validation}
+    
+    # Content hashes are 16 bytes (32 hex chars); blobs above this size hash on all cores
+    HASH_DIGEST_SIZE = 16
+    HASH_THREADS_THRESHOLD = 1024 * 1024
+    
+    @classmethod
+    def content_hash(cls, data: Union[bytes, bytearray, memoryview]) -> str:
+        """Hex content hash for deduplication, BLAKE3 when installed and BLAKE2b otherwise"""
+        if blake3 is not None:
+            threads = blake3.blake3.AUTO if len(data) > cls.HASH_THREADS_THRESHOLD else 1
+            return blake3.blake3(data, max_threads=threads).hexdigest(length=cls.HASH_DIGEST_SIZE)
+        return hashlib.blake2b(data, digest_size=cls.HASH_DIGEST_SIZE).hexdigest()
+    
+    @classmethod
+    def file_hash(cls, file_path: Union[str, Path]) -> str:
+        """Content hash of a file, memory-mapped instead of read into a buffer"""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls.content_hash(b'')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return cls.content_hash(mapped)
+
+class JSONHandler:
+    """Fast JSON encoding/decoding with orjson, falling back to stdlib json"""
+    
+    @classmethod
+    def dumps(cls, obj: Any, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes (non-serializable values use str)"""
+        if orjson is not None:
+            # datetime and numpy arrays are encoded natively, so default=str rarely fires
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, option=option, default=str)
+        
+        return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+    
+    @classmethod
+    def loads(cls, data: Union[str, bytes]) -> Any:
+        """Deserialize JSON from str or bytes"""
+        if orjson is not None:
+            return orjson.loads(data)
+        
+        return json.loads(data)
 
 class SystemMetrics:
     """System monitoring and metrics utilities"""
     
+    # cpu_percent(interval=None) reports usage since the previous call; prime it
+    # at import so even the first sample is an instant, non-blocking delta
+    if psutil is not None:
+        psutil.cpu_percent(interval=None)
+    
+    # Last sample as (monotonic time, metrics), reused for METRICS_TTL seconds
+    METRICS_TTL = 1.0
+    _metrics_cache = (0.0, None)
+    
+    # Values that never change while the process runs
+    _CPU_COUNT = psutil.cpu_count() if psutil else None
+    _CPU_COUNT_LOGICAL = psutil.cpu_count(logical=True) if psutil else None
+    _BOOT_TIME = psutil.boot_time() if psutil else None
+    
     @classmethod
-    def get_system_metrics(cls) -> Dict[str, Any]:
-        """Get comprehensive system metrics"""
-        try:
-            import psutil
-            
-            # Memory information
-            memory = psutil.virtual_memory()
-            
-            # Disk information
-            disk = psutil.disk_usage('/')
-            
-            # CPU information
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # Process information
-            process_count = len(psutil.pids())
+    def get_system_metrics(cls, force: bool = False) -> Dict[str, Any]:
+        """Get comprehensive system metrics, reusing a sample taken within the last second"""
+        now = time.monotonic()
+        sampled_at, metrics = cls._metrics_cache
+        
+        if force or metrics is None or now - sampled_at >= cls.METRICS_TTL:
+            metrics = cls._collect_system_metrics()
+            cls._metrics_cache = (now, metrics)
+        
+        # Callers get their own copy; the cached sample is shared
+        return copy.deepcopy(metrics)
+    
+    @classmethod
+    async def get_system_metrics_async(cls, force: bool = False) -> Dict[str, Any]:
+        """Get system metrics with each psutil probe running concurrently off the event loop"""
+        now = time.monotonic()
+        sampled_at, metrics = cls._metrics_cache
+        
+        if force or metrics is None or now - sampled_at >= cls.METRICS_TTL:
+            if psutil is None:
+                metrics = cls._collect_system_metrics()
+            else:
+                metrics = await cls._gather_system_metrics()
             
-            return {
-                'memory': {
-                    'total_gb': round(memory.total / (1024**3), 2),
-                    'available_gb': round(memory.available / (1024**3), 2),
-                    'used_gb': round(memory.used / (1024**3), 2),
-                    'percent': memory.percent
-                },
-                'disk': {
-                    'total_gb': round(disk.total / (1024**3), 2),
-                    'free_gb': round(disk.free / (1024**3), 2),
-                    'used_gb': round(disk.used / (1024**3), 2),
-                    'percent': round((disk.used / disk.total) * 100, 1)
-                },
-                'cpu': {
-                    'percent': cpu_percent,
-                    'count': psutil.cpu_count(),
-                    'count_logical': psutil.cpu_count(logical=True)
-                },
-                'system': {
-                    'process_count': process_count,
-                    'boot_time': psutil.boot_time()
-                },
-                'timestamp': datetime.now().isoformat()
-            }
-        except ImportError:
+            cls._metrics_cache = (now, metrics)
+        
+        return copy.deepcopy(metrics)
+    
+    @classmethod
+    async def _gather_system_metrics(cls) -> Dict[str, Any]:
+        """Run the psutil probes concurrently in worker threads"""
+        try:
+            memory, disk, cpu_percent, process_count = await asyncio.gather(
+                asyncio.to_thread(psutil.virtual_memory),
+                asyncio.to_thread(psutil.disk_usage, '/'),
+                asyncio.to_thread(cls._sample_cpu_percent),
+                asyncio.to_thread(cls._count_processes)
+            )
+            return cls._build_metrics(memory, disk, cpu_percent, process_count)
+        except Exception as e:
+            logger.error(f"Failed to get system metrics: {e}")
+            return cls._get_fallback_metrics()
+    
+    @classmethod
+    def _collect_system_metrics(cls) -> Dict[str, Any]:
+        """Sample system metrics from psutil"""
+        if psutil is None:
             logger.warning("psutil not available, using fallback metrics")
             return cls._get_fallback_metrics()
+        
+        try:
+            return cls._build_metrics(
+                psutil.virtual_memory(),
+                psutil.disk_usage('/'),
+                cls._sample_cpu_percent(),
+                cls._count_processes()
+            )
         except Exception as e:
             logger.error(f"Failed to get system metrics: {e}")
             return cls._get_fallback_metrics()
     
+    @classmethod
+    def _sample_cpu_percent(cls) -> float:
+        """CPU usage since the previous sample (or import); never blocks"""
+        return psutil.cpu_percent(interval=None)
+    
+    @classmethod
+    def _count_processes(cls) -> int:
+        """Number of running processes"""
+        # On Linux, count /proc PID entries without building a list of every PID
+        if sys.platform.startswith('linux'):
+            with os.scandir('/proc') as entries:
+                return sum(1 for entry in entries if entry.name.isdigit())
+        
+        return len(psutil.pids())
+    
+    @classmethod
+    def _build_metrics(cls, memory: Any, disk: Any, cpu_percent: float, process_count: int) -> Dict[str, Any]:
+        """Assemble the metrics dict from raw psutil samples"""
+        return {
+            'memory': {
+                'total_gb': round(memory.total / (1024**3), 2),
+                'available_gb': round(memory.available / (1024**3), 2),
+                'used_gb': round(memory.used / (1024**3), 2),
+                'percent': memory.percent
+            },
+            'disk': {
+                'total_gb': round(disk.total / (1024**3), 2),
+                'free_gb': round(disk.free / (1024**3), 2),
+                'used_gb': round(disk.used / (1024**3), 2),
+                'percent': round((disk.used / disk.total) * 100, 1)
+            },
+            'cpu': {
+                'percent': cpu_percent,
+                'count': cls._CPU_COUNT,
+                'count_logical': cls._CPU_COUNT_LOGICAL
+            },
+            'system': {
+                'process_count': process_count,
+                'boot_time': cls._BOOT_TIME
+            },
+            'timestamp': datetime.now().isoformat()
+        }
+    
     @classmethod
     def _get_fallback_metrics(cls) -> Dict[str, Any]:
         """Fallback metrics when psutil is not available"""
@@ -462,10 +779,31 @@ class SystemMetrics:
         
         return {**health, 'metrics': metrics}
 
+def _compile_format_template(template: str) -> Callable[[Dict[str, Any]], str]:
+    """Parse a str.format template once into a renderer taking a kwargs mapping"""
+    parsed = list(string.Formatter().parse(template))
+    
+    # Conversions, format specs, positional or attribute fields keep full str.format handling
+    if any(
+        spec or conversion or (field is not None and not field.isidentifier())
+        for _, field, spec, conversion in parsed
+    ):
+        return template.format_map
+    
+    parts = tuple((literal, field) for literal, field, _, _ in parsed)
+    
+    def render(values: Dict[str, Any]) -> str:
+        return ''.join(
+            literal if field is None else literal + format(values[field])
+            for literal, field in parts
+        )
+    
+    return render
+
 class PromptTemplates:
     """Shared prompt templates for AI interactions"""
     
-    SYSTEM_PROMPTS = {
+    SYSTEM_PROMPTS = MappingProxyType({
         'security_analyst': """You are an expert cybersecurity analyst with deep knowledge of:
 - Vulnerability assessment and penetration testing
 - Threat intelligence and malware analysis
@@ -492,9 +830,9 @@ Always provide educational content for authorized testing only.""",
 - Risk prioritization and impact assessment
 
 Focus on actionable intelligence and defensive recommendations."""
-    }
+    })
     
-    TASK_PROMPTS = {
+    TASK_PROMPTS = MappingProxyType({
         'vulnerability_analysis': """Analyze the following for security vulnerabilities:
 
 Target: {target}
@@ -536,44 +874,60 @@ Provide:
 5. Recovery recommendations
 
 Prioritize containment and evidence preservation."""
-    }
+    })
+    
+    DEFAULT_TASK_PROMPT = "Analyze the following: {context}"
+    
+    # Task templates parsed once; rendering only substitutes values
+    _TASK_RENDERERS = MappingProxyType({
+        task_type: _compile_format_template(template)
+        for task_type, template in TASK_PROMPTS.items()
+    })
+    _DEFAULT_TASK_RENDERER = _compile_format_template(DEFAULT_TASK_PROMPT)
     
     @classmethod
     def get_system_prompt(cls, agent_type: str) -> str:
         """Get system prompt for agent type"""
-        return cls.SYSTEM_PROMPTS.get(agent_type, cls.SYSTEM_PROMPTS['security_analyst'])
+        return cls._system_prompt(agent_type)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _system_prompt(agent_type: str) -> str:
+        """Memoized system prompt lookup"""
+        prompts = PromptTemplates.SYSTEM_PROMPTS
+        return prompts.get(agent_type, prompts['security_analyst'])
     
     @classmethod
     def get_task_prompt(cls, task_type: str, **kwargs) -> str:
         """Get formatted task prompt"""
-        template = cls.TASK_PROMPTS.get(task_type, "Analyze the following: {context}")
-        return template.format(**kwargs)
+        return cls._TASK_RENDERERS.get(task_type, cls._DEFAULT_TASK_RENDERER)(kwargs)
     
     @classmethod
     def format_security_prompt(cls, task: str, context: Dict[str, Any] = None) -> str:
         """Format a general security analysis prompt"""
         context = context or {}
         
-        prompt = f"""Security Analysis Request:
+        parts = [f"""Security Analysis Request:
 Task: {task}
 
 Context:
-"""
-        for key, value in context.items():
-            prompt += f"- {key}: {value}\n"
-        
-        prompt += """
+"""]
+        parts.extend(f"- {key}: {value}\n" for key, value in context.items())
+        parts.append("""
 Please provide a comprehensive security analysis including:
 1. Risk assessment
 2. Potential vulnerabilities or threats
 3. Mitigation recommendations
 4. Additional considerations
 
-Maintain ethical guidelines and focus on defensive security."""
+Maintain ethical guidelines and focus on defensive security.""")
         
-        return prompt
+        return ''.join(parts)
+
+# Configuration loaded once at import and shared by every component
+CONFIG = ConfigManager.get_instance().config
 
-def initialize_shared_components() -> Dict[str, Any]:
+async def initialize_shared_components() -> Dict[str, Any]:
     """Initialize all shared components"""
     logger.info("🚀 Initializing shared components...")
     
@@ -581,23 +935,25 @@ def initialize_shared_components() -> Dict[str, Any]:
     
     try:
         # Initialize configuration
-        config_manager = ConfigManager()
+        ConfigManager.get_instance()
         results['config'] = 'initialized'
         
-        # Create directories
-        DirectoryManager.create_all_directories()
-        results['directories'] = 'created'
-        
         # Validate environment
         env_validation = EnvironmentValidator.validate_environment()
         results['environment'] = env_validation
         
-        # Initialize Gemini client
-        gemini_client = GeminiClient()
+        # Initialize Gemini client (SDK import and configure) off the event loop
+        gemini_client = await asyncio.to_thread(GeminiClient)
         results['gemini'] = 'available' if gemini_client.is_available else 'not_configured'
         
-        # Check system health
-        system_health = SystemMetrics.check_system_health()
+        # Overlap the Gemini handshake with the health check and directory creation
+        connection, system_health, _ = await asyncio.gather(
+            gemini_client.test_connection(),
+            asyncio.to_thread(SystemMetrics.check_system_health),
+            asyncio.to_thread(DirectoryManager.create_all_directories)
+        )
+        results['directories'] = 'created'
+        results['gemini_connection'] = connection['status']
         results['system_health'] = system_health['status']
         
         logger.info("✅ Shared components initialized successfully")
@@ -608,6 +964,10 @@ def initialize_shared_components() -> Dict[str, Any]:
     
     return results
 
+def initialize_shared_components_sync() -> Dict[str, Any]:
+    """Initialize shared components from code without a running event loop"""
+    return asyncio.run(initialize_shared_components())
+
 # Compatibility functions for backward compatibility
 def setup_logging(component: str) -> None:
     """Backward compatibility function"""
@@ -4,55 +4,300 @@ Central orchestration and routing of tasks
 """
 
 import asyncio
-import json
+import concurrent.futures
+import hashlib
 import os
+import re
+import sqlite3
+import threading
 import psutil
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import subprocess
+import time
 
+import aiofiles
+import msgspec
+import numpy as np
 from loguru import logger
 import yaml
 
 # Import our modules
-from pentestgpt_gemini import PentestGPTGemini
-from rag_embedder import RAGEmbedder
-from file_parser import FileParser
-from rss_fetcher import RSSFetcher
-from shared_utils import (
-    ConfigManager, LoggerManager, DirectoryManager,
-    SystemMetrics, PromptTemplates
-)
+from agents.pentestgpt_gemini import PentestGPTGemini
+from agents.rag_embedder import RAGEmbedder
+from agents.file_parser import FileParser
+from agents.rss_fetcher import RSSFetcher
+from core.shared_utils import LoggerManager, YAMLLoader
+from core.schemas import ScanResult
+
+def _count_newlines(path: Path) -> int:
+    """Count lines in a file by scanning raw bytes in 1 MiB chunks"""
+    count = 0
+    with open(path, 'rb') as f:
+        while buf := f.read(1 << 20):
+            count += buf.count(b'\n')
+    return count
+
+def _count_log_lines(paths: List[Path]) -> int:
+    """Sum line counts over log files, skipping unreadable ones"""
+    total = 0
+    for path in paths:
+        try:
+            total += _count_newlines(path)
+        except OSError:
+            continue
+    return total
+
+def _preview(text: str, max_len: int) -> str:
+    """Shorten text to max_len characters plus an ellipsis; short text is returned as is"""
+    return f"{text[:max_len]}..." if len(text) > max_len else text
+
+def _latest_mtime(root: str, suffixes: tuple, recursive: bool = True) -> float:
+    """Newest mtime among files under root ending in suffixes, 0.0 if none"""
+    best = 0.0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffixes):
+                        mtime = entry.stat().st_mtime
+                        if mtime > best:
+                            best = mtime
+        except OSError:
+            continue
+    return best
+
+def _count_processed_files(root: str) -> int:
+    """Count file_*.json records in each category directory under root"""
+    total = 0
+    with os.scandir(root) as categories:
+        for category in categories:
+            if category.is_dir() and category.name != 'chroma_db':
+                with os.scandir(category.path) as it:
+                    total += sum(1 for e in it if e.name.startswith('file_') and e.name.endswith('.json'))
+    return total
+
+class _ProximityCache:
+    """Approximate cache returning stored results for near-duplicate query embeddings"""
+    
+    def __init__(self, max_size: int = 512, tau: float = 0.05, ttl: float = 3600.0):
+        self.max_size = max_size
+        self.tau = tau  # Maximum cosine distance counted as a hit
+        self.ttl = ttl  # Seconds an entry may be served after it was stored
+        
+        # Per namespace: unit vectors (c, dim), parallel entries and last-use ticks
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._entries: Dict[str, List[tuple]] = {}
+        self._last_used: Dict[str, List[int]] = {}
+        self._tick = 0
+    
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> Optional[np.ndarray]:
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+    
+    def get(self, namespace: str, vector: np.ndarray, context: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the cached result closest to vector if it lies within tau"""
+        entry = self.nearest(namespace, vector, context)
+        return entry[2] if entry else None
+    
+    def nearest(self, namespace: str, vector: np.ndarray, context: Optional[str] = None) -> Optional[tuple]:
+        """Return the (query, context, result, timestamp, evidence_ids) entry within tau of vector and ttl"""
+        matrix = self._vectors.get(namespace)
+        q = self._normalize(vector)
+        if matrix is None or q is None or q.shape[0] != matrix.shape[1]:
+            return None
+        
+        dists = 1.0 - matrix @ q
+        idx = int(dists.argmin())
+        entry = self._entries[namespace][idx]
+        if dists[idx] > self.tau or entry[1] != context or time.time() - entry[3] > self.ttl:
+            return None
+        
+        self._tick += 1
+        self._last_used[namespace][idx] = self._tick
+        return entry
+    
+    def put(self, namespace: str, vector: np.ndarray, query: str, context: Optional[str], result: Dict[str, Any],
+            evidence_ids: Optional[Set[str]] = None):
+        """Store a result, evicting the least recently used entry when full"""
+        q = self._normalize(vector)
+        if q is None:
+            return
+        
+        self._tick += 1
+        entry = (query, context, result, time.time(), evidence_ids)
+        matrix = self._vectors.get(namespace)
+        
+        if matrix is None or q.shape[0] != matrix.shape[1]:
+            self._vectors[namespace] = q[np.newaxis, :]
+            self._entries[namespace] = [entry]
+            self._last_used[namespace] = [self._tick]
+        elif len(self._entries[namespace]) < self.max_size:
+            self._vectors[namespace] = np.vstack((matrix, q))
+            self._entries[namespace].append(entry)
+            self._last_used[namespace].append(self._tick)
+        else:
+            last_used = self._last_used[namespace]
+            idx = last_used.index(min(last_used))
+            matrix[idx] = q
+            self._entries[namespace][idx] = entry
+            last_used[idx] = self._tick
+    
+    def clear(self, prefix: str = ''):
+        """Drop every namespace starting with prefix"""
+        for namespace in [ns for ns in self._vectors if ns.startswith(prefix)]:
+            del self._vectors[namespace]
+            del self._entries[namespace]
+            del self._last_used[namespace]
+
+class _EmbeddingStore:
+    """SQLite table of query embeddings keyed by SHA-256 of model name and query"""
+    
+    # Stay under SQLite's bound-parameter limit in IN (...) lookups
+    _LOOKUP_CHUNK = 500
+    
+    def __init__(self, path: str, model_name: str):
+        self.model_name = model_name
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings(hash BLOB PRIMARY KEY, vec BLOB, created REAL)"
+        )
+        self._db.commit()
+        
+        # Lookups and writes run in worker threads that share this connection
+        self._lock = threading.Lock()
+    
+    def _hash(self, query: str) -> bytes:
+        # The model name is part of the key so a model change never returns stale vectors
+        return hashlib.sha256(self.model_name.encode() + b'|' + query.encode()).digest()
+    
+    def get_many(self, queries: List[str]) -> Dict[str, np.ndarray]:
+        """Return the stored embeddings for whichever queries have one"""
+        by_hash = {self._hash(query): query for query in queries}
+        hashes = list(by_hash)
+        found = {}
+        with self._lock:
+            for i in range(0, len(hashes), self._LOOKUP_CHUNK):
+                chunk = hashes[i:i + self._LOOKUP_CHUNK]
+                rows = self._db.execute(
+                    f"SELECT hash, vec FROM embeddings WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+                )
+                for digest, vec in rows:
+                    found[by_hash[digest]] = np.frombuffer(vec, dtype=np.float32)
+        return found
+    
+    def put_many(self, items: List[tuple]):
+        """Persist (query, embedding) pairs"""
+        now = time.time()
+        rows = [(self._hash(query), np.asarray(vector, dtype=np.float32).tobytes(), now) for query, vector in items]
+        with self._lock:
+            self._db.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?)", rows)
+            self._db.commit()
 
 class TaskRouter:
+    # Checked in priority order; case folding is left to the regex engine
+    _TASK_PATTERNS = {
+        'scan': re.compile(r'scan|nmap|enumerate|discover', re.IGNORECASE),
+        'analysis': re.compile(r'how to|exploit|vulnerability|attack', re.IGNORECASE),
+        'search': re.compile(r'search|find|look for|show me', re.IGNORECASE),
+        'rss': re.compile(r'rss|news|feeds|updates', re.IGNORECASE)
+    }
+    
+    # Analysis terms mapped to the scan findings they produce, in report order
+    _FINDINGS = {
+        'sql injection': "• Potential SQL injection vectors identified in input forms",
+        'xss': "• Cross-site scripting vulnerabilities may exist",
+        'network': "• Network services enumerated, potential attack surface identified",
+        'authentication': "• Authentication mechanisms analyzed for weaknesses"
+    }
+    _FINDINGS_PATTERN = re.compile('|'.join(map(re.escape, _FINDINGS)), re.IGNORECASE)
+    
+    # First IPv4 address or dotted domain name in a message
+    _TARGET_RE = re.compile(r'\b(?:(?:\d{1,3}\.){3}\d{1,3}|(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,})\b')
+    
+    # Minimum Jaccard overlap between cached and freshly retrieved evidence to reuse an answer
+    EVIDENCE_JACCARD = 0.6
+    
+    # Status snapshots are reused for STATUS_TTL seconds, psutil samples for METRICS_TTL
+    STATUS_TTL = 2.0
+    METRICS_TTL = 1.0
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.start_time = datetime.now()
         
+        # Near-duplicate queries reuse earlier RAG context and analyses
+        self._proximity_cache = _ProximityCache()
+        self._search_corpus_version = RAGEmbedder.corpus_version
+        
+        # Exact repeats of a query reuse its embedding
+        self._embed_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._embed_cache_size = 1024
+        
+        # Embeddings persisted across restarts, checked after the in-process LRU
+        self._embedding_store = None
+        try:
+            self._embedding_store = _EmbeddingStore(
+                self.config.get('embedding_cache_path', './rag_data/embeddings/query_cache.db'),
+                self.config['rag']['embedding_model']
+            )
+        except Exception as e:
+            logger.warning(f"Persistent embedding cache unavailable: {e}")
+        
+        # Last status as (monotonic time, status); the lock lets concurrent callers share one scan
+        self._status_cache: Optional[tuple] = None
+        self._status_lock = asyncio.Lock()
+        self._sysmetrics_cache: Optional[tuple] = None
+        
+        # Shared cap on in-flight Gemini analyses across every route
+        self._llm_sem = asyncio.Semaphore(self.config.get('llm_concurrency', 8))
+        
         # Initialize components
         self.pentestgpt = None
         self.rag_embedder = None
         self.file_parser = None
         self.rss_fetcher = None
-        
-        # Initialize components lazily to save memory
-        self._initialize_components()
+        self._rag_init_failed = False
+        
+        # Load the embedding model and Chroma in the background; first use awaits it
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='rag-init')
+        self._rag_future = executor.submit(RAGEmbedder, self.config)
+        executor.shutdown(wait=False)
+        
+        # Natural language task type -> handler taking the raw message
+        self._dispatch = {
+            'scan': self._dispatch_scan,
+            'analysis': self.route_thinking_task,
+            'search': self._dispatch_search,
+            'rss': self._dispatch_rss
+        }
         
         # Setup logging using shared utility
         LoggerManager.setup_logger('task_router')
         
         logger.info("🧵 Task Router initialized with shared utilities")
 
-    def _initialize_components(self):
-        """Initialize components lazily"""
-        try:
-            self.rag_embedder = RAGEmbedder(self.config)
-            logger.info("RAG Embedder initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize RAG Embedder: {e}")
+    async def _get_rag_embedder(self) -> Optional[RAGEmbedder]:
+        """Wait for the background RAG Embedder load; None if it failed"""
+        if self.rag_embedder is None and not self._rag_init_failed:
+            try:
+                self.rag_embedder = await asyncio.wrap_future(self._rag_future)
+                logger.info("RAG Embedder initialized")
+            except Exception as e:
+                self._rag_init_failed = True
+                logger.error(f"Failed to initialize RAG Embedder: {e}")
+        return self.rag_embedder
 
-    async def route_scan_task(self, target: str) -> Dict[str, Any]:
+    async def route_scan_task(self, target: str) -> ScanResult:
         """Route scanning task - can integrate with external tools"""
         logger.info(f"Routing scan task for target: {target}")
         
@@ -71,24 +316,24 @@ class TaskRouter:
             scan_query = f"Provide a comprehensive security scanning approach for target: {target}. Include reconnaissance, vulnerability assessment, and enumeration strategies."
             
             # Get analysis from PentestGPT
-            analysis = await self.pentestgpt.analyze_security_scenario(scan_query)
+            analysis = await self._analyze(scan_query)
             
             # Simulate scan results (in production, integrate with real tools)
             scan_results = await self._simulate_scan_results(target, analysis)
             
-            result = {
-                'target': target,
-                'scan_type': 'comprehensive',
-                'status': 'completed',
-                'summary': scan_results['summary'],
-                'findings': scan_results['findings'],
-                'recommendations': scan_results['recommendations'],
-                'timestamp': datetime.now().isoformat(),
-                'analysis_id': analysis.get('timestamp', '')
-            }
+            # One clock read for both the result and its report filename
+            now = datetime.now()
+            result = ScanResult(
+                target=target,
+                summary=scan_results['summary'],
+                findings=scan_results['findings'],
+                recommendations=scan_results['recommendations'],
+                timestamp=now.isoformat(),
+                analysis_id=str(analysis.get('timestamp', ''))
+            )
             
             # Save scan results
-            await self._save_scan_results(result)
+            await self._save_scan_results(result, now)
             
             logger.info(f"Scan task completed for: {target}")
             return result
@@ -108,15 +353,8 @@ class TaskRouter:
         summary = f"Security scan completed for {target}. Analysis focused on web application security, network enumeration, and vulnerability assessment."
         
         # Generate findings based on analysis
-        findings = []
-        if 'sql injection' in detailed_analysis.lower():
-            findings.append("• Potential SQL injection vectors identified in input forms")
-        if 'xss' in detailed_analysis.lower():
-            findings.append("• Cross-site scripting vulnerabilities may exist")
-        if 'network' in detailed_analysis.lower():
-            findings.append("• Network services enumerated, potential attack surface identified")
-        if 'authentication' in detailed_analysis.lower():
-            findings.append("• Authentication mechanisms analyzed for weaknesses")
+        matched = {m.group().lower() for m in self._FINDINGS_PATTERN.finditer(detailed_analysis)}
+        findings = [finding for term, finding in self._FINDINGS.items() if term in matched]
         
         if not findings:
             findings = ["• General security posture assessed", "• Attack surface enumerated"]
@@ -139,20 +377,106 @@ class TaskRouter:
             'recommendations': recommendations_text
         }
 
+    async def _analyze(self, query: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Run a PentestGPT analysis within the shared LLM concurrency limit"""
+        async with self._llm_sem:
+            return await self.pentestgpt.analyze_security_scenario(query, context)
+
+    async def _embed_query(self, query: str) -> np.ndarray:
+        """Embed a query once per normalized string"""
+        key = query.strip().lower()
+        if key in self._embed_cache:
+            self._embed_cache.move_to_end(key)
+            return self._embed_cache[key]
+        
+        return (await self._embed_queries([key]))[0]
+
+    async def _embed_queries(self, queries: List[str]) -> List[np.ndarray]:
+        """Embed queries in one batch, reusing embeddings cached in memory or on disk"""
+        keys = [query.strip().lower() for query in queries]
+        vectors = {key: self._embed_cache.get(key) for key in keys}
+        missing = [key for key, vector in vectors.items() if vector is None]
+        
+        if missing and self._embedding_store:
+            try:
+                vectors.update(await asyncio.to_thread(self._embedding_store.get_many, missing))
+                missing = [key for key in missing if vectors[key] is None]
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache lookup failed: {e}")
+        
+        if missing:
+            rag_embedder = await self._get_rag_embedder()
+            if rag_embedder is None:
+                raise ValueError("RAG Embedder not available")
+            embedded = list(zip(missing, await rag_embedder.embed_batch(missing)))
+            vectors.update(embedded)
+            if self._embedding_store:
+                try:
+                    await asyncio.to_thread(self._embedding_store.put_many, embedded)
+                except sqlite3.Error as e:
+                    logger.warning(f"Embedding cache write failed: {e}")
+        
+        for key, vector in vectors.items():
+            self._embed_cache[key] = vector
+            self._embed_cache.move_to_end(key)
+        while len(self._embed_cache) > self._embed_cache_size:
+            self._embed_cache.popitem(last=False)
+        
+        return [vectors[key] for key in keys]
+
+    async def _cached_answer(self, rag_embedder: RAGEmbedder, vector: np.ndarray,
+                             context: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Cached thinking result for a near-duplicate query whose RAG evidence still matches"""
+        entry = self._proximity_cache.nearest('thinking', vector, context)
+        if entry is None:
+            return None
+        
+        # Answers grounded in retrieved documents are reused only if retrieval still agrees
+        cached_ids = entry[4]
+        if cached_ids is not None:
+            try:
+                current_ids = await rag_embedder.search_ids_by_vector(vector, n_results=5)
+            except Exception:
+                return None
+            union = cached_ids | current_ids
+            if union and len(cached_ids & current_ids) / len(union) < self.EVIDENCE_JACCARD:
+                logger.debug("Proximity cache hit rejected: retrieved evidence changed")
+                return None
+        
+        return entry[2]
+
     async def route_thinking_task(self, query: str, context: Optional[str] = None) -> Dict[str, Any]:
         """Route analytical thinking task to PentestGPT"""
         logger.info(f"Routing thinking task: {query[:50]}...")
         
         try:
+            rag_embedder = await self._get_rag_embedder()
+            
+            # Paraphrases of earlier questions skip the RAG and Gemini calls
+            query_vector = None
+            if rag_embedder:
+                try:
+                    query_vector = await self._embed_query(query)
+                except Exception as e:
+                    logger.warning(f"Query embedding failed, skipping proximity cache: {e}")
+            if query_vector is not None and (cached := await self._cached_answer(rag_embedder, query_vector, context)):
+                logger.info("Thinking task served from proximity cache")
+                return {**cached, 'cache_hit': True}
+            
+            caller_context = context
+            
             if not self.pentestgpt:
                 self.pentestgpt = PentestGPTGemini(self.config)
             
             # Get RAG context if available
-            if self.rag_embedder and not context:
-                context = await self.rag_embedder.get_context_for_query(query)
+            evidence_ids = None
+            if rag_embedder and not context:
+                context, evidence_ids = await rag_embedder.get_context_with_evidence(
+                    query, query_embeddings=query_vector
+                )
             
             # Perform analysis
-            analysis = await self.pentestgpt.analyze_security_scenario(query, context)
+            analysis = await self._analyze(query, context)
             
             result = {
                 'query': query,
@@ -161,13 +485,86 @@ class TaskRouter:
                 'timestamp': datetime.now().isoformat()
             }
             
+            if query_vector is not None:
+                self._proximity_cache.put('thinking', query_vector, query, caller_context, result, evidence_ids)
+            
             logger.info("Thinking task completed")
-            return result
+            return {**result, 'cache_hit': False}
             
         except Exception as e:
             logger.error(f"Thinking task failed: {e}")
             raise
 
+    async def route_batch_thinking_task(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """Route many thinking tasks with one embedding call and bounded LLM fan-out"""
+        logger.info(f"Routing batch of {len(queries)} thinking tasks")
+        
+        try:
+            results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+            vectors: List[Optional[np.ndarray]] = [None] * len(queries)
+            rag_embedder = await self._get_rag_embedder()
+            
+            if rag_embedder and queries:
+                try:
+                    vectors = await self._embed_queries(queries)
+                except Exception as e:
+                    logger.warning(f"Batch embedding failed, skipping proximity cache: {e}")
+            
+            # Queries already answered never reach the LLM
+            cached = [None] * len(queries)
+            if rag_embedder:
+                cached = await asyncio.gather(*[
+                    self._cached_answer(rag_embedder, vector) if vector is not None else asyncio.sleep(0)
+                    for vector in vectors
+                ])
+            
+            pending = []
+            for i, answer in enumerate(cached):
+                if answer:
+                    results[i] = {**answer, 'cache_hit': True}
+                else:
+                    pending.append(i)
+            
+            if not pending:
+                logger.info("Batch thinking task served from proximity cache")
+                return results
+            
+            if not self.pentestgpt:
+                self.pentestgpt = PentestGPTGemini(self.config)
+            
+            contexts: List[Optional[str]] = [None] * len(pending)
+            evidence: List[Optional[Set[str]]] = [None] * len(pending)
+            if rag_embedder:
+                retrieved = await asyncio.gather(*[
+                    rag_embedder.get_context_with_evidence(queries[i], query_embeddings=vectors[i])
+                    for i in pending
+                ])
+                contexts, evidence = zip(*retrieved)
+            
+            analyses = await asyncio.gather(*[
+                self._analyze(queries[i], context) for i, context in zip(pending, contexts)
+            ])
+            
+            timestamp = datetime.now().isoformat()
+            for i, context, evidence_ids, analysis in zip(pending, contexts, evidence, analyses):
+                result = {
+                    'query': queries[i],
+                    'analysis': analysis,
+                    'context_used': bool(context),
+                    'timestamp': timestamp
+                }
+                if vectors[i] is not None:
+                    self._proximity_cache.put('thinking', vectors[i], queries[i], None, result, evidence_ids)
+                results[i] = {**result, 'cache_hit': False}
+            
+            logger.info(f"Batch thinking task completed: {len(pending)} analyzed, "
+                        f"{len(queries) - len(pending)} from cache")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Batch thinking task failed: {e}")
+            raise
+
     async def route_file_analysis_task(self, file_path: str) -> Dict[str, Any]:
         """Route file analysis task"""
         logger.info(f"Routing file analysis task: {file_path}")
@@ -220,21 +617,34 @@ class TaskRouter:
         logger.info(f"Routing search task: {query[:50]}...")
         
         try:
-            if not self.rag_embedder:
+            rag_embedder = await self._get_rag_embedder()
+            if not rag_embedder:
                 raise ValueError("RAG Embedder not available")
             
+            # Search results cached before new documents were added are stale
+            if RAGEmbedder.corpus_version != self._search_corpus_version:
+                self._proximity_cache.clear('search:')
+                self._search_corpus_version = RAGEmbedder.corpus_version
+            
+            namespace = f"search:{collection or '*'}"
+            query_vector = await self._embed_query(query)
+            if cached := self._proximity_cache.get(namespace, query_vector):
+                logger.info("Search task served from proximity cache")
+                return {**cached, 'cache_hit': True}
+            
             # Perform search
-            results = await self.rag_embedder.search_similar(query, collection)
+            results = await rag_embedder.search_similar_by_vector(query_vector, collection)
             
             # Format results for display
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    'content': result['content'][:300] + "..." if len(result['content']) > 300 else result['content'],
+            formatted_results = [
+                {
+                    'content': _preview(result['content'], 300),
                     'source': result['metadata'].get('source', 'Unknown'),
                     'category': result['metadata'].get('category', 'Unknown'),
                     'similarity_score': result['similarity_score']
-                })
+                }
+                for result in results
+            ]
             
             search_result = {
                 'query': query,
@@ -243,8 +653,10 @@ class TaskRouter:
                 'timestamp': datetime.now().isoformat()
             }
             
+            self._proximity_cache.put(namespace, query_vector, query, None, search_result)
+            
             logger.info(f"Search task completed: {len(results)} results")
-            return search_result
+            return {**search_result, 'cache_hit': False}
             
         except Exception as e:
             logger.error(f"Search task failed: {e}")
@@ -252,27 +664,12 @@ class TaskRouter:
 
     async def detect_task_type(self, message: str) -> str:
         """Detect the type of task from user message"""
-        message_lower = message.lower()
-        
-        # Scan-related keywords
-        if any(keyword in message_lower for keyword in ['scan', 'nmap', 'enumerate', 'discover']):
-            return 'scan'
-        
-        # Analysis/thinking keywords
-        elif any(keyword in message_lower for keyword in ['how to', 'exploit', 'vulnerability', 'attack']):
-            return 'analysis'
-        
-        # Search keywords
-        elif any(keyword in message_lower for keyword in ['search', 'find', 'look for', 'show me']):
-            return 'search'
-        
-        # RSS keywords
-        elif any(keyword in message_lower for keyword in ['rss', 'news', 'feeds', 'updates']):
-            return 'rss'
+        for task_type, pattern in self._TASK_PATTERNS.items():
+            if pattern.search(message):
+                return task_type
         
         # Default to analysis
-        else:
-            return 'analysis'
+        return 'analysis'
 
     async def process_natural_language_task(self, message: str) -> Dict[str, Any]:
         """Process natural language task and route appropriately"""
@@ -282,44 +679,35 @@ class TaskRouter:
             # Detect task type
             task_type = await self.detect_task_type(message)
             
-            if task_type == 'scan':
-                # Extract target from message
-                target = await self._extract_target_from_message(message)
-                return await self.route_scan_task(target)
-            
-            elif task_type == 'analysis':
-                return await self.route_thinking_task(message)
-            
-            elif task_type == 'search':
-                # Extract search query
-                search_query = await self._extract_search_query_from_message(message)
-                return await self.route_search_task(search_query)
-            
-            elif task_type == 'rss':
-                return await self.route_rss_task()
-            
-            else:
-                # Default to analysis
-                return await self.route_thinking_task(message)
+            # Default to analysis
+            handler = self._dispatch.get(task_type, self.route_thinking_task)
+            return await handler(message)
                 
         except Exception as e:
             logger.error(f"Natural language task processing failed: {e}")
             raise
 
+    async def _dispatch_scan(self, message: str) -> Dict[str, Any]:
+        """Scan the target named in the message"""
+        target = await self._extract_target_from_message(message)
+        return msgspec.structs.asdict(await self.route_scan_task(target))
+
+    async def _dispatch_search(self, message: str) -> Dict[str, Any]:
+        """Search for the query extracted from the message"""
+        search_query = await self._extract_search_query_from_message(message)
+        return await self.route_search_task(search_query)
+
+    async def _dispatch_rss(self, message: str) -> Dict[str, Any]:
+        """Fetch RSS feeds; the message carries no parameters"""
+        return await self.route_rss_task()
+
     async def _extract_target_from_message(self, message: str) -> str:
         """Extract target from scan message"""
         # Simple extraction - could be improved with NLP
-        words = message.split()
-        
-        # Look for domain-like patterns or IP addresses
-        for word in words:
-            if '.' in word and not word.startswith('.'):
-                # Simple check for domain or IP
-                if any(char.isalpha() for char in word) or word.replace('.', '').isdigit():
-                    return word.strip('.,;!?')
+        match = self._TARGET_RE.search(message)
         
         # If no clear target found, return a placeholder
-        return "target-not-specified"
+        return match.group() if match else "target-not-specified"
 
     async def _extract_search_query_from_message(self, message: str) -> str:
         """Extract search query from message"""
@@ -334,45 +722,79 @@ class TaskRouter:
         
         return query
 
+    async def _metrics_snapshot(self) -> Dict[str, float]:
+        """Memory and disk usage from one psutil sample shared by status and health checks"""
+        now = time.monotonic()
+        if self._sysmetrics_cache and now - self._sysmetrics_cache[0] < self.METRICS_TTL:
+            return self._sysmetrics_cache[1]
+        
+        memory, disk = await asyncio.gather(
+            asyncio.to_thread(psutil.virtual_memory),
+            asyncio.to_thread(psutil.disk_usage, '/')
+        )
+        snapshot = {'mem_pct': memory.percent, 'disk_pct': disk.percent}
+        self._sysmetrics_cache = (now, snapshot)
+        return snapshot
+
     async def get_system_status(self) -> Dict[str, Any]:
+        """Get comprehensive system status, reusing a snapshot younger than STATUS_TTL"""
+        # Callers get their own copy so formatting one reply cannot alter the cached snapshot
+        async with self._status_lock:
+            if self._status_cache and time.monotonic() - self._status_cache[0] < self.STATUS_TTL:
+                return dict(self._status_cache[1])
+            
+            status = await self._collect_system_status()
+            if status['system_health'] != 'Error':
+                self._status_cache = (time.monotonic(), status)
+            return dict(status)
+
+    async def _collect_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status using shared utilities"""
         try:
-            # Use shared system metrics
-            system_metrics = SystemMetrics.get_system_metrics()
-            
             # Calculate uptime
             uptime = datetime.now() - self.start_time
             uptime_str = str(uptime).split('.')[0]  # Remove microseconds
             
-            # RAG statistics
-            rag_stats = {}
-            if self.rag_embedder:
-                try:
-                    rag_stats = await self.rag_embedder.get_collection_stats()
-                except Exception as e:
-                    logger.error(f"Failed to get RAG stats: {e}")
-                    rag_stats = {'total_documents': 0}
-            
-            # Log file counts
-            log_entries = await self._count_log_entries()
-            
-            # File processing statistics
-            file_stats = await self._get_file_processing_stats()
-            
-            # Recent activities
-            recent_activities = await self._get_recent_activities()
+            async def rag_collection_stats() -> Dict[str, Any]:
+                rag_embedder = await self._get_rag_embedder()
+                return await rag_embedder.get_collection_stats() if rag_embedder else {}
+            
+            # Independent disk/DB traversals run concurrently
+            system_metrics, rag_stats, log_entries, file_stats, recent_activities = await asyncio.gather(
+                self._metrics_snapshot(),
+                rag_collection_stats(),
+                self._count_log_entries(),
+                self._get_file_processing_stats(),
+                self._get_recent_activities(),
+                return_exceptions=True
+            )
+            
+            if isinstance(system_metrics, Exception):
+                raise system_metrics
+            if isinstance(rag_stats, Exception):
+                logger.error(f"Failed to get RAG stats: {rag_stats}")
+                rag_stats = {'total_documents': 0}
+            if isinstance(log_entries, Exception):
+                log_entries = 0
+            if isinstance(file_stats, Exception):
+                file_stats = {'total_files': 0}
+            if isinstance(recent_activities, Exception):
+                recent_activities = {}
+            
+            memory_percent = system_metrics['mem_pct']
+            disk_percent = system_metrics['disk_pct']
             
             status = {
                 'uptime': uptime_str,
-                'memory_usage': system_metrics['memory_percent'],
-                'disk_usage': system_metrics['disk_percent'],
+                'memory_usage': memory_percent,
+                'disk_usage': disk_percent,
                 'rag_documents': rag_stats.get('total_documents', 0),
                 'log_entries': log_entries,
                 'processed_files': file_stats.get('total_files', 0),
                 'last_rss_update': recent_activities.get('last_rss_update', 'Never'),
                 'last_report': recent_activities.get('last_report', 'Never'),
                 'last_finetune': recent_activities.get('last_finetune', 'Never'),
-                'system_health': 'Good' if system_metrics['memory_percent'] < 80 and system_metrics['disk_percent'] < 90 else 'Warning'
+                'system_health': 'Good' if memory_percent < 80 and disk_percent < 90 else 'Warning'
             }
             
             return status
@@ -386,7 +808,7 @@ class TaskRouter:
                 'system_health': 'Error'
             }
 
-    async def _save_scan_results(self, result: Dict[str, Any]):
+    async def _save_scan_results(self, result: ScanResult, now: Optional[datetime] = None):
         """Save scan results to file"""
         try:
             # Create reports directory
@@ -394,11 +816,11 @@ class TaskRouter:
             reports_dir.mkdir(parents=True, exist_ok=True)
             
             # Save scan result
-            filename = f"scan_{result['target']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = f"scan_{result.target}_{(now or datetime.now()).strftime('%Y%m%d_%H%M%S')}.json"
             filepath = reports_dir / filename
             
-            with open(filepath, 'w') as f:
-                json.dump(result, f, indent=2, default=str)
+            async with aiofiles.open(filepath, 'wb') as f:
+                await f.write(msgspec.json.format(msgspec.json.encode(result), indent=2))
             
             logger.info(f"Scan results saved: {filepath}")
             
@@ -408,18 +830,14 @@ class TaskRouter:
     async def _count_log_entries(self) -> int:
         """Count total log entries"""
         try:
-            log_count = 0
             logs_dir = Path("logs")
             
-            if logs_dir.exists():
-                for log_file in logs_dir.rglob("*.log"):
-                    try:
-                        with open(log_file, 'r') as f:
-                            log_count += sum(1 for _ in f)
-                    except Exception:
-                        continue
+            if not logs_dir.exists():
+                return 0
             
-            return log_count
+            # Byte-level counting runs in a worker thread to keep the loop free
+            log_files = list(logs_dir.rglob("*.log"))
+            return await asyncio.to_thread(_count_log_lines, log_files)
             
         except Exception as e:
             logger.error(f"Failed to count log entries: {e}")
@@ -432,13 +850,10 @@ class TaskRouter:
                 return await self.file_parser.get_processing_statistics()
             else:
                 # Count processed files manually
-                rag_data_dir = Path("rag_data")
                 total_files = 0
                 
-                if rag_data_dir.exists():
-                    for category_dir in rag_data_dir.iterdir():
-                        if category_dir.is_dir() and category_dir.name != 'chroma_db':
-                            total_files += len(list(category_dir.glob('file_*.json')))
+                if os.path.isdir("rag_data"):
+                    total_files = await asyncio.to_thread(_count_processed_files, "rag_data")
                 
                 return {'total_files': total_files}
                 
@@ -455,35 +870,17 @@ class TaskRouter:
         }
         
         try:
-            # Check RSS logs
-            rss_logs = Path("logs/rss")
-            if rss_logs.exists():
-                rss_files = list(rss_logs.glob("*.log"))
-                if rss_files:
-                    latest_rss = max(rss_files, key=lambda x: x.stat().st_mtime)
-                    activities['last_rss_update'] = datetime.fromtimestamp(
-                        latest_rss.stat().st_mtime
-                    ).strftime('%Y-%m-%d %H:%M')
-            
-            # Check reports
-            reports_dir = Path("reports")
-            if reports_dir.exists():
-                report_files = list(reports_dir.rglob("*.md")) + list(reports_dir.rglob("*.json"))
-                if report_files:
-                    latest_report = max(report_files, key=lambda x: x.stat().st_mtime)
-                    activities['last_report'] = datetime.fromtimestamp(
-                        latest_report.stat().st_mtime
-                    ).strftime('%Y-%m-%d %H:%M')
-            
-            # Check fine-tuning data
-            finetune_dir = Path("finetune_data/processed")
-            if finetune_dir.exists():
-                finetune_files = list(finetune_dir.glob("*.jsonl"))
-                if finetune_files:
-                    latest_finetune = max(finetune_files, key=lambda x: x.stat().st_mtime)
-                    activities['last_finetune'] = datetime.fromtimestamp(
-                        latest_finetune.stat().st_mtime
-                    ).strftime('%Y-%m-%d %H:%M')
+            # One scandir walk per source; DirEntry.stat avoids extra lookups
+            latest = await asyncio.gather(
+                asyncio.to_thread(_latest_mtime, "logs/rss", (".log",), False),
+                asyncio.to_thread(_latest_mtime, "reports", (".md", ".json")),
+                asyncio.to_thread(_latest_mtime, "finetune_data/processed", (".jsonl",), False)
+            )
+            
+            fmt = '%Y-%m-%d %H:%M'
+            for key, mtime in zip(('last_rss_update', 'last_report', 'last_finetune'), latest):
+                if mtime:
+                    activities[key] = time.strftime(fmt, time.localtime(mtime))
             
         except Exception as e:
             logger.error(f"Failed to get recent activities: {e}")
@@ -499,6 +896,10 @@ class TaskRouter:
             'timestamp': datetime.now().isoformat()
         }
         
+        # Pick up a background load that has finished without blocking on one still running
+        if self._rag_future.done():
+            await self._get_rag_embedder()
+        
         # Check components
         components = {
             'rag_embedder': self.rag_embedder,
@@ -513,15 +914,21 @@ class TaskRouter:
             else:
                 health['components'][name] = 'inactive'
         
+        if not self._rag_future.done():
+            health['components']['rag_embedder'] = 'loading'
+        elif self._rag_init_failed:
+            health['components']['rag_embedder'] = 'failed'
+            health['issues'].append('RAG Embedder failed to initialize')
+            health['overall_status'] = 'warning'
+        
         # Check system resources
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        metrics = await self._metrics_snapshot()
         
-        if memory.percent > 90:
+        if metrics['mem_pct'] > 90:
             health['issues'].append('High memory usage')
             health['overall_status'] = 'warning'
         
-        if disk.percent > 95:
+        if metrics['disk_pct'] > 95:
             health['issues'].append('Low disk space')
             health['overall_status'] = 'critical'
         
@@ -538,7 +945,7 @@ if __name__ == "__main__":
     # Test the task router
     async def test_task_router():
         with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAMLLoader)
         
         router = TaskRouter(config)
         
@@ -4,42 +4,93 @@ Handles all user interactions and command routing
 """
 
 import asyncio
+import functools
+import hashlib
+import io
 import os
+import shutil
 import sys
+import tempfile
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Awaitable, Callable, Tuple
 
+import aiofiles
+import httpx
 from telegram import Update, Document, Message
 from telegram.ext import (
     Application, CommandHandler, MessageHandler, 
-    ContextTypes, filters
+    ContextTypes, filters, AIORateLimiter
 )
 from telegram.constants import ParseMode
-import yaml
+from telegram.request import HTTPXRequest
 from loguru import logger
 from dotenv import load_dotenv
 
-# Import our modules
-from task_router import TaskRouter
-from pentestgpt_gemini import PentestGPTGemini
-from rss_fetcher import RSSFetcher
-from file_parser import FileParser
-from report_generator import ReportGenerator
-from finetune_preparer import FineTunePreparer
-from shared_utils import (
-    ConfigManager, LoggerManager, DirectoryManager,
-    EnvironmentValidator, SystemMetrics
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Import our modules (agent modules are imported on first use, see the component properties)
+from core.shared_utils import (
+    CONFIG, LoggerManager,
+    EnvironmentValidator, SystemMetrics, FileHandler, now_str
 )
 
 # Load environment variables
 load_dotenv()
 
+# Static /help reply, built once at import
+HELP_TEXT = """
+🤖 **Cybersecurity AI Agent Commands**
+
+**Core Commands:**
+• `/scan <target>` - Trigger security scan of target
+• `/think <query>` - Use PentestGPT for analysis
+• `/report <type>` - Generate security report (latest/daily/weekly)
+• `/file` - Upload file for analysis (reply to file)
+• `/rss now` - Fetch latest security RSS feeds
+• `/fine_tune` - Prepare fine-tuning data
+
+**Utility Commands:**
+• `/status` - Show system status
+• `/help` - Show this help message
+
+**Usage Examples:**
+```
+/scan example.com
+/think how to exploit SQL injection in login form
+/report latest
+/rss now
+```
+
+📝 **File Upload:** Send any PDF, text, or markdown file and reply with `/file` to analyze it.
+
+🔍 **PentestGPT:** Ask complex security questions with `/think` for detailed analysis.
+""".strip()
+
 class CybersecurityBot:
+    # Seconds Telegram may hold a getUpdates long poll open
+    POLL_TIMEOUT = 30
+    
+    # Longer replies are uploaded as a single Markdown document
+    DOCUMENT_THRESHOLD = 8192
+    
+    # Completed /think and /scan results are reused for RESULT_TTL seconds
+    RESULT_TTL = 300.0
+    RESULT_CACHE_SIZE = 256
+    
+    # Uploads above STREAM_THRESHOLD go straight to disk in STREAM_CHUNK_SIZE pieces
+    STREAM_THRESHOLD = 8 * 1024 * 1024
+    STREAM_CHUNK_SIZE = 1024 * 1024
+    MAX_UPLOAD_SIZE = 50 * 1024 * 1024
+    
     def __init__(self):
-        # Load configuration using shared utility
-        self.config_manager = ConfigManager()
-        self.config = self.config_manager.config
+        # Use configuration loaded once by shared utilities
+        self.config = CONFIG
         
         # Environment validation
         env_validation = EnvironmentValidator.validate_environment()
@@ -47,30 +98,90 @@ class CybersecurityBot:
             logger.error("Critical environment variables missing!")
             sys.exit(1)
         
-        self.authorized_user_id = int(os.getenv('AUTHORIZED_USER_ID'))
+        # Comma-separated IDs; the handler filter drops everyone else before dispatch
+        self.authorized_user_ids = frozenset(
+            int(user_id) for user_id in os.getenv('AUTHORIZED_USER_ID', '').split(',') if user_id.strip()
+        )
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         
         # Setup logging using shared utility
         LoggerManager.setup_logger('telegram')
         
-        # Initialize components
-        self.task_router = TaskRouter(self.config)
-        self.pentestgpt = PentestGPTGemini(self.config)
-        self.rss_fetcher = RSSFetcher(self.config)
-        self.file_parser = FileParser(self.config)
-        self.report_generator = ReportGenerator(self.config)
-        self.finetune_preparer = FineTunePreparer(self.config)
+        # Serializes handlers per chat while different chats run concurrently;
+        # each chat maps to [lock, handlers holding or waiting], dropped when idle
+        self._chat_locks: Dict[Optional[int], list] = {}
+        
+        # Identical queries share one in-flight upstream call, then a short-lived result
+        self._inflight: Dict[Tuple[str, bytes], asyncio.Future] = {}
+        self._results: OrderedDict[Tuple[str, bytes], Tuple[float, Any]] = OrderedDict()
         
         logger.info("🤖 Cybersecurity AI Agent Bot initialized with shared utilities")
 
+    # Components are imported and built the first time a command needs them
+    @functools.cached_property
+    def task_router(self):
+        from core.task_router import TaskRouter
+        return TaskRouter(self.config)
+
+    @functools.cached_property
+    def pentestgpt(self):
+        from agents.pentestgpt_gemini import PentestGPTGemini
+        return PentestGPTGemini(self.config)
+
+    @functools.cached_property
+    def rss_fetcher(self):
+        from agents.rss_fetcher import RSSFetcher
+        return RSSFetcher(self.config)
+
+    @functools.cached_property
+    def file_parser(self):
+        from agents.file_parser import FileParser
+        return FileParser(self.config)
+
+    @functools.cached_property
+    def report_generator(self):
+        from agents.report_generator import ReportGenerator
+        return ReportGenerator(self.config)
+
+    @functools.cached_property
+    def finetune_preparer(self):
+        from integrations.finetune_preparer import FineTunePreparer
+        return FineTunePreparer(self.config)
+
+    def _coalesce(self, kind: str, text: str, call: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+        """Share one upstream call between identical concurrent requests and cache its result"""
+        key = (kind, hashlib.blake2b(text.lower().strip().encode(), digest_size=16).digest())
+        
+        cached = self._results.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self.RESULT_TTL:
+                self._results.move_to_end(key)
+                future = asyncio.get_running_loop().create_future()
+                future.set_result(cached[1])
+                return future
+            del self._results[key]
+        
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._inflight[key] = future
+            
+            def _done(done: asyncio.Future):
+                self._inflight.pop(key, None)
+                if done.cancelled() or done.exception() is not None:
+                    return
+                self._results[key] = (time.monotonic(), done.result())
+                if len(self._results) > self.RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+            
+            future.add_done_callback(_done)
+        
+        # A cancelled handler must not cancel the call other requesters are awaiting
+        return asyncio.shield(future)
+
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file"""
-        try:
-            with open('config.yaml', 'r') as f:
-                return yaml.safe_load(f)
-        except FileNotFoundError:
-            logger.error("config.yaml not found!")
-            sys.exit(1)
+        """Return the configuration loaded once at startup"""
+        return CONFIG
 
     def _setup_logging(self):
         """Configure logging"""
@@ -81,67 +192,70 @@ class CybersecurityBot:
             log_dir / f"bot_{datetime.now().strftime('%Y-%m-%d')}.log",
             rotation="1 day",
             retention="30 days",
-            level="INFO"
+            level="INFO",
+            enqueue=True,
+            buffering=LoggerManager.BUFFER_SIZE
         )
 
     def _check_authorization(self, user_id: int) -> bool:
         """Check if user is authorized"""
-        return user_id == self.authorized_user_id
+        return user_id in self.authorized_user_ids
+
+    async def _download_upload(self, file, file_size: Optional[int], temp_path: str) -> str:
+        """Fetch an uploaded file to temp_path and return its content hash"""
+        # Document.file_size is optional in the Bot API; unknown sizes stream to be safe
+        if file_size is None or file_size > self.STREAM_THRESHOLD:
+            # Large files stream network-to-disk so memory stays at one chunk
+            async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=10.0)) as client:
+                async with client.stream('GET', file.file_path) as response:
+                    response.raise_for_status()
+                    received = 0
+                    async with aiofiles.open(temp_path, 'wb') as f:
+                        async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                            # Uploads without a reported size are capped while they stream
+                            received += len(chunk)
+                            if received > self.MAX_UPLOAD_SIZE:
+                                raise ValueError("File too large (max 50MB)")
+                            await f.write(chunk)
+            return await asyncio.to_thread(FileHandler.file_hash, temp_path)
+        
+        buffer = io.BytesIO()
+        await file.download_to_memory(buffer)
+        async with aiofiles.open(temp_path, 'wb') as f:
+            await f.write(buffer.getbuffer())
+        return await asyncio.to_thread(FileHandler.content_hash, buffer.getbuffer())
+
+    async def _parse_upload(self, temp_dir: str, temp_path: str) -> Dict[str, Any]:
+        """Run a downloaded upload through the file parser, then remove its scratch directory"""
+        try:
+            return await self.file_parser.process_file(temp_path)
+        finally:
+            await asyncio.to_thread(shutil.rmtree, temp_dir, True)
 
     async def _send_long_message(self, update: Update, text: str, parse_mode=ParseMode.MARKDOWN):
         """Send long messages by splitting them if needed"""
         max_length = 4096
         if len(text) <= max_length:
             await update.message.reply_text(text, parse_mode=parse_mode)
+        elif len(text) > self.DOCUMENT_THRESHOLD:
+            # One upload instead of a burst of chunked messages
+            await update.message.reply_document(
+                document=io.BytesIO(text.encode('utf-8')),
+                filename="response.md"
+            )
         else:
-            # Split message into chunks
+            # Split message into chunks, sent in order
             chunks = [text[i:i+max_length] for i in range(0, len(text), max_length)]
             for chunk in chunks:
                 await update.message.reply_text(chunk, parse_mode=parse_mode)
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show help message"""
-        if not self._check_authorization(update.effective_user.id):
-            await update.message.reply_text("❌ Unauthorized access")
-            return
-
-        help_text = """
-🤖 **Cybersecurity AI Agent Commands**
-
-**Core Commands:**
-• `/scan <target>` - Trigger security scan of target
-• `/think <query>` - Use PentestGPT for analysis
-• `/report <type>` - Generate security report (latest/daily/weekly)
-• `/file` - Upload file for analysis (reply to file)
-• `/rss now` - Fetch latest security RSS feeds
-• `/fine_tune` - Prepare fine-tuning data
-
-**Utility Commands:**
-• `/status` - Show system status
-• `/help` - Show this help message
-
-**Usage Examples:**
-```
-/scan example.com
-/think how to exploit SQL injection in login form
-/report latest
-/rss now
-```
-
-📝 **File Upload:** Send any PDF, text, or markdown file and reply with `/file` to analyze it.
-
-🔍 **PentestGPT:** Ask complex security questions with `/think` for detailed analysis.
-        """
-        
-        await self._send_long_message(update, help_text)
+        await update.message.reply_text(HELP_TEXT, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
         logger.info(f"Help command used by user {update.effective_user.id}")
 
     async def scan_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle scan command"""
-        if not self._check_authorization(update.effective_user.id):
-            await update.message.reply_text("❌ Unauthorized access")
-            return
-
         if not context.args:
             await update.message.reply_text("❌ Please provide a target: `/scan example.com`", 
                                           parse_mode=ParseMode.MARKDOWN)
@@ -153,20 +267,20 @@ class CybersecurityBot:
         
         try:
             # Route to task router for scan execution
-            result = await self.task_router.route_scan_task(target)
+            result = await self._coalesce('scan', target, lambda: self.task_router.route_scan_task(target))
             
             response = f"""
 🎯 **Scan Results for {target}**
 
-{result['summary']}
+{result.summary}
 
 **Findings:**
-{result['findings']}
+{result.findings}
 
 **Recommendations:**
-{result['recommendations']}
+{result.recommendations}
 
-📊 Scan completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+📊 Scan completed at {now_str()}
             """
             
             await self._send_long_message(update, response)
@@ -178,10 +292,6 @@ class CybersecurityBot:
 
     async def think_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle PentestGPT thinking command"""
-        if not self._check_authorization(update.effective_user.id):
-            await update.message.reply_text("❌ Unauthorized access")
-            return
-
         if not context.args:
             await update.message.reply_text("❌ Please provide a query: `/think how to exploit XSS`", 
                                           parse_mode=ParseMode.MARKDOWN)
@@ -193,7 +303,7 @@ class CybersecurityBot:
         
         try:
             # Get analysis from PentestGPT
-            analysis = await self.pentestgpt.analyze_security_scenario(query)
+            analysis = await self._coalesce('think', query, lambda: self.pentestgpt.analyze_security_scenario(query))
             
             response = f"""
 🧠 **PentestGPT Analysis**
@@ -209,7 +319,7 @@ class CybersecurityBot:
 **Mitigation:**
 {analysis['mitigation_strategies']}
 
-⏰ Analysis completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ Analysis completed at {now_str()}
             """
             
             await self._send_long_message(update, response)
@@ -221,10 +331,6 @@ class CybersecurityBot:
 
     async def report_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle report generation command"""
-        if not self._check_authorization(update.effective_user.id):
-            await update.message.reply_text("❌ Unauthorized access")
-            return
-
         report_type = context.args[0] if context.args else "latest"
         
         await update.message.reply_text(f"📊 Generating {report_type} report...", 
@@ -235,21 +341,12 @@ class CybersecurityBot:
             
             # Send report as file if it's long, otherwise as message
             if len(report['content']) > 3000:
-                # Save to temp file and send
-                temp_file = f"temp/report_{report_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-                os.makedirs('temp', exist_ok=True)
-                
-                with open(temp_file, 'w') as f:
-                    f.write(report['content'])
-                
+                # Upload straight from memory; the report is already a string
                 await update.message.reply_document(
-                    document=open(temp_file, 'rb'),
+                    document=io.BytesIO(report['content'].encode('utf-8')),
                     filename=f"security_report_{report_type}.md",
                     caption=f"📊 {report['title']}"
                 )
-                
-                # Clean up temp file
-                os.remove(temp_file)
             else:
                 await self._send_long_message(update, report['content'])
             
@@ -261,10 +358,6 @@ class CybersecurityBot:
 
     async def rss_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle RSS feed fetching command"""
-        if not self._check_authorization(update.effective_user.id):
-            await update.message.reply_text("❌ Unauthorized access")
-            return
-
         action = context.args[0] if context.args else "now"
         
         if action == "now":
@@ -284,7 +377,7 @@ class CybersecurityBot:
 **Recent Highlights:**
 {results['highlights']}
 
-🕒 Updated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+🕒 Updated at {now_str()}
                 """
                 
                 await self._send_long_message(update, summary)
@@ -296,10 +389,6 @@ class CybersecurityBot:
 
     async def file_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle file uploads"""
-        if not self._check_authorization(update.effective_user.id):
-            await update.message.reply_text("❌ Unauthorized access")
-            return
-
         # Check if message is a reply to a file
         if not (update.message.reply_to_message and update.message.reply_to_message.document):
             await update.message.reply_text("❌ Please reply to a file with `/file` command")
@@ -308,7 +397,7 @@ class CybersecurityBot:
         document = update.message.reply_to_message.document
         
         # Check file size and type
-        if document.file_size > 50 * 1024 * 1024:  # 50MB limit
+        if (document.file_size or 0) > self.MAX_UPLOAD_SIZE:  # 50MB limit
             await update.message.reply_text("❌ File too large (max 50MB)")
             return
 
@@ -316,14 +405,29 @@ class CybersecurityBot:
                                       parse_mode=ParseMode.MARKDOWN)
         
         try:
-            # Download file
             file = await context.bot.get_file(document.file_id)
-            temp_path = f"temp/{document.file_name}"
+            
+            # Parsers key off the original name, so keep it inside a per-upload directory
             os.makedirs('temp', exist_ok=True)
-            await file.download_to_drive(temp_path)
+            temp_dir = await asyncio.to_thread(tempfile.mkdtemp, dir='temp')
+            temp_path = os.path.join(temp_dir, os.path.basename(document.file_name))
+            
+            # The parse call owns the directory once started; otherwise it is removed here
+            parsing = False
             
-            # Parse and analyze file
-            analysis = await self.file_parser.process_file(temp_path)
+            def parse():
+                nonlocal parsing
+                parsing = True
+                return self._parse_upload(temp_dir, temp_path)
+            
+            try:
+                digest = await self._download_upload(file, document.file_size, temp_path)
+                
+                # Re-uploads of the same bytes reuse the in-flight or recent analysis
+                analysis = await self._coalesce('file', digest, parse)
+            finally:
+                if not parsing:
+                    await asyncio.to_thread(shutil.rmtree, temp_dir, True)
             
             response = f"""
 📄 **File Analysis Complete**
@@ -344,8 +448,6 @@ class CybersecurityBot:
             
             await self._send_long_message(update, response)
             
-            # Clean up temp file
-            os.remove(temp_path)
             logger.info(f"File analyzed: {document.file_name}")
             
         except Exception as e:
@@ -354,10 +456,6 @@ class CybersecurityBot:
 
     async def finetune_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle fine-tuning preparation command"""
-        if not self._check_authorization(update.effective_user.id):
-            await update.message.reply_text("❌ Unauthorized access")
-            return
-
         await update.message.reply_text("🧪 Preparing fine-tuning data...")
         
         try:
@@ -389,10 +487,6 @@ class CybersecurityBot:
 
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show system status using shared utilities"""
-        if not self._check_authorization(update.effective_user.id):
-            await update.message.reply_text("❌ Unauthorized access")
-            return
-
         try:
             # Get system metrics using shared utility
             system_metrics = SystemMetrics.get_system_metrics()
@@ -426,33 +520,80 @@ class CybersecurityBot:
             await update.message.reply_text(f"❌ Status check failed: {str(e)}")
             logger.error(f"Status check error: {e}")
 
+    def _per_chat(self, handler):
+        """Wrap a handler so updates from the same chat are processed one at a time"""
+        @functools.wraps(handler)
+        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            chat_id = update.effective_chat.id if update.effective_chat else None
+            entry = self._chat_locks.setdefault(chat_id, [asyncio.Lock(), 0])
+            entry[1] += 1
+            try:
+                async with entry[0]:
+                    return await handler(update, context)
+            finally:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._chat_locks[chat_id]
+        
+        return wrapper
+
+    def _build_application(self) -> Application:
+        """Create the application with pooled HTTP clients and register command handlers"""
+        telegram_config = self.config.get('telegram', {})
+        pool_size = telegram_config.get('connection_pool_size', 256)
+        
+        # getUpdates holds one long-poll connection; Bot API calls share a keep-alive pool
+        builder = (
+            Application.builder()
+            .token(self.bot_token)
+            .get_updates_request(HTTPXRequest(connection_pool_size=1, read_timeout=self.POLL_TIMEOUT))
+            .request(HTTPXRequest(connection_pool_size=pool_size, http_version="1.1"))
+            .concurrent_updates(telegram_config.get('max_concurrent_updates', 64))
+        )
+        
+        # Stay under Telegram's 30 msg/s global and 20 msg/min per-group limits
+        try:
+            builder.rate_limiter(AIORateLimiter(
+                overall_max_rate=28, overall_time_period=1,
+                group_max_rate=18, group_time_period=60,
+                max_retries=3
+            ))
+        except RuntimeError as e:
+            logger.warning(f"⚠️ Telegram rate limiter unavailable (install python-telegram-bot[rate-limiter]): {e}")
+        
+        application = builder.build()
+
+        # Add command handlers; updates run concurrently across chats, in order within one
+        authorized = filters.User(user_id=self.authorized_user_ids)
+        application.add_handler(CommandHandler("help", self._per_chat(self.help_command), filters=authorized))
+        application.add_handler(CommandHandler("scan", self._per_chat(self.scan_command), filters=authorized))
+        application.add_handler(CommandHandler("think", self._per_chat(self.think_command), filters=authorized))
+        application.add_handler(CommandHandler("report", self._per_chat(self.report_command), filters=authorized))
+        application.add_handler(CommandHandler("rss", self._per_chat(self.rss_command), filters=authorized))
+        application.add_handler(CommandHandler("file", self._per_chat(self.file_handler), filters=authorized))
+        application.add_handler(CommandHandler("fine_tune", self._per_chat(self.finetune_command), filters=authorized))
+        application.add_handler(CommandHandler("status", self._per_chat(self.status_command), filters=authorized))
+        
+        return application
+
     async def run_async(self):
         """Start the bot asynchronously for use with main platform"""
         if not self.bot_token:
             logger.error("TELEGRAM_BOT_TOKEN not set!")
             sys.exit(1)
         
-        if not self.authorized_user_id:
+        if not self.authorized_user_ids:
             logger.error("AUTHORIZED_USER_ID not set!")
             sys.exit(1)
 
-        # Create application
-        application = Application.builder().token(self.bot_token).build()
-
-        # Add command handlers
-        application.add_handler(CommandHandler("help", self.help_command))
-        application.add_handler(CommandHandler("scan", self.scan_command))
-        application.add_handler(CommandHandler("think", self.think_command))
-        application.add_handler(CommandHandler("report", self.report_command))
-        application.add_handler(CommandHandler("rss", self.rss_command))
-        application.add_handler(CommandHandler("file", self.file_handler))
-        application.add_handler(CommandHandler("fine_tune", self.finetune_command))
-        application.add_handler(CommandHandler("status", self.status_command))
+        application = self._build_application()
 
         # Start bot polling
         await application.initialize()
         await application.start()
-        await application.updater.start_polling(allowed_updates=Update.ALL_TYPES)
+        await application.updater.start_polling(
+            poll_interval=0, timeout=self.POLL_TIMEOUT, allowed_updates=Update.ALL_TYPES
+        )
         
         # Keep running
         import signal
@@ -475,26 +616,21 @@ class CybersecurityBot:
             logger.error("TELEGRAM_BOT_TOKEN not set!")
             sys.exit(1)
         
-        if not self.authorized_user_id:
+        if not self.authorized_user_ids:
             logger.error("AUTHORIZED_USER_ID not set!")
             sys.exit(1)
 
-        # Create application
-        application = Application.builder().token(self.bot_token).build()
+        application = self._build_application()
 
-        # Add command handlers
-        application.add_handler(CommandHandler("help", self.help_command))
-        application.add_handler(CommandHandler("scan", self.scan_command))
-        application.add_handler(CommandHandler("think", self.think_command))
-        application.add_handler(CommandHandler("report", self.report_command))
-        application.add_handler(CommandHandler("rss", self.rss_command))
-        application.add_handler(CommandHandler("file", self.file_handler))
-        application.add_handler(CommandHandler("fine_tune", self.finetune_command))
-        application.add_handler(CommandHandler("status", self.status_command))
+        # run_polling creates its own loop; make it libuv-backed when uvloop is installed
+        # (run_async inherits whatever loop the platform entry point installed)
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("⚡ uvloop event loop enabled")
 
         # Start bot
         logger.info("🚀 Starting Cybersecurity AI Agent Bot...")
-        application.run_polling(allowed_updates=Update.ALL_TYPES)
+        application.run_polling(poll_interval=0, timeout=self.POLL_TIMEOUT, allowed_updates=Update.ALL_TYPES)
 
 if __name__ == "__main__":
     bot = CybersecurityBot()
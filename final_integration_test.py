@@ -4,25 +4,32 @@ Final Integration Test for Live Platform
 Tests components while platform is running
 """
 
-import requests
+import asyncio
+import aiohttp
 import json
 import os
 from datetime import datetime
 from pathlib import Path
 
-def test_telegram_bot():
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+async def test_telegram_bot():
     """Test Telegram bot accessibility"""
     try:
         token = os.getenv('TELEGRAM_BOT_TOKEN')
         if not token or token == 'test_token_placeholder':
             return False, "No valid token"
         
-        response = requests.get(f'https://api.telegram.org/bot{token}/getMe', timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            if data['ok']:
-                return True, f"Bot: @{data['result']['username']}"
-        return False, f"HTTP {response.status_code}"
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            async with session.get(f'https://api.telegram.org/bot{token}/getMe') as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data['ok']:
+                        return True, f"Bot: @{data['result']['username']}"
+                return False, f"HTTP {response.status}"
     except Exception as e:
         return False, str(e)
 
@@ -45,6 +52,23 @@ def test_gemini_api():
     except Exception as e:
         return False, str(e)
 
+def _walk(root, suffix):
+    """Count files under root ending in suffix and return (count, (mtime, size, path) of the newest)"""
+    stack = [root]
+    best = None
+    count = 0
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    count += 1
+                    st = entry.stat()
+                    if best is None or st.st_mtime > best[0]:
+                        best = (st.st_mtime, st.st_size, entry.path)
+    return count, best
+
 def test_database():
     """Test database and storage"""
     try:
@@ -53,8 +77,8 @@ def test_database():
             return False, "ChromaDB not found"
         
         # Check for collection files
-        collection_files = list(chroma_path.rglob('*.sqlite3'))
-        return True, f"{len(collection_files)} collections active"
+        collection_count, _ = _walk(str(chroma_path), '.sqlite3')
+        return True, f"{collection_count} collections active"
     except Exception as e:
         return False, str(e)
 
@@ -65,15 +89,14 @@ def test_logs():
         if not log_path.exists():
             return False, "Log directory missing"
         
-        log_files = list(log_path.rglob('*.log'))
-        if not log_files:
+        # One pass counts the logs and finds the latest for recent activity
+        log_count, latest_log = _walk(str(log_path), '.log')
+        if not log_count:
             return False, "No log files found"
         
-        # Check latest log for recent activity
-        latest_log = max(log_files, key=lambda f: f.stat().st_mtime)
-        size_kb = latest_log.stat().st_size / 1024
+        size_kb = latest_log[1] / 1024
         
-        return True, f"{len(log_files)} logs, latest: {size_kb:.1f}KB"
+        return True, f"{log_count} logs, latest: {size_kb:.1f}KB"
     except Exception as e:
         return False, str(e)
 
@@ -96,7 +119,13 @@ def test_file_structure():
         return False, f"Missing: {missing_files}"
     return True, f"{len(required_files)} files present"
 
-def main():
+async def _run_test(test_func):
+    """Run a probe, moving blocking ones to a worker thread"""
+    if asyncio.iscoroutinefunction(test_func):
+        return await test_func()
+    return await asyncio.to_thread(test_func)
+
+async def main():
     """Run final integration tests"""
     print("🧪 FINAL INTEGRATION TEST - LIVE PLATFORM")
     print("=" * 50)
@@ -109,16 +138,22 @@ def main():
         ("📁 File Structure", test_file_structure)
     ]
     
+    # Probes are independent, so total time is the slowest one rather than the sum
+    outcomes = await asyncio.gather(
+        *[_run_test(test_func) for _, test_func in tests],
+        return_exceptions=True
+    )
+    
     results = []
-    for test_name, test_func in tests:
-        try:
-            success, message = test_func()
+    for (test_name, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"{test_name}: ❌ ERROR - {outcome}")
+            results.append((test_name, False, str(outcome)))
+        else:
+            success, message = outcome
             status = "✅ PASS" if success else "❌ FAIL"
             print(f"{test_name}: {status} - {message}")
             results.append((test_name, success, message))
-        except Exception as e:
-            print(f"{test_name}: ❌ ERROR - {e}")
-            results.append((test_name, False, str(e)))
     
     # Summary
     passed = sum(1 for _, success, _ in results if success)
@@ -136,16 +171,19 @@ def main():
         print("└── Status: ⚠️ NEEDS ATTENTION")
     
     # Save results
-    with open('final_test_results.json', 'w') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'tests': [{'name': name, 'passed': success, 'message': msg} for name, success, msg in results],
-            'summary': {'passed': passed, 'total': total, 'success_rate': passed/total*100}
-        }, f, indent=2)
+    payload = {
+        'timestamp': datetime.now().isoformat(),
+        'tests': [{'name': name, 'passed': success, 'message': msg} for name, success, msg in results],
+        'summary': {'passed': passed, 'total': total, 'success_rate': passed/total*100}
+    }
+    if orjson is not None:
+        Path('final_test_results.json').write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        Path('final_test_results.json').write_text(json.dumps(payload, indent=2))
     
     print(f"\n💾 Results saved to: final_test_results.json")
 
 if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
-    main()
+    asyncio.run(main())
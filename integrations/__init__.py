@@ -0,0 +1 @@
+"""Framework and service integrations for the Cybersecurity AI Agent Platform"""
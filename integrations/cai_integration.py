@@ -5,19 +5,165 @@ Provides unified interface to CAI framework components with local model integrat
 """
 
 import asyncio
-import os
 import sys
 import json
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# Optional query/document embeddings for the semantic answer cache and vector search
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# Optional vector index over the knowledge base; keyword scoring is used without it
+try:
+    import faiss
+except ImportError:
+    faiss = None
 
 # Add CAI to Python path
 cai_path = Path(__file__).parent.parent / "CAI" / "src"
 if cai_path.exists():
     sys.path.insert(0, str(cai_path))
 
-from shared_utils import ConfigManager, LoggerManager
-from local_llm_server import LocalLLMAPI
+# Document fields embedded for vector search, in the order they are concatenated
+_INDEXED_FIELDS = ('content', 'analysis', 'summary', 'techniques', 'tools', 'key_topics')
+
+def _document_text(doc_data: Dict[str, Any]) -> str:
+    """Concatenate a knowledge base document's text fields for embedding"""
+    return "\n".join(str(doc_data[field]) for field in _INDEXED_FIELDS if field in doc_data)
+
+class _SemanticCache:
+    """RAG answers keyed by exact query text or, given embeddings, random-projection LSH buckets
+    
+    A sign bit collides with probability 1 - arccos(cos)/pi, about 0.857 at cosine 0.9.
+    With 8 tables of 6 bits a pair at the 0.9 threshold shares a bucket in at least one
+    table with probability 1 - (1 - 0.857**6)**8, roughly 98%, and closer pairs more often.
+    """
+    
+    def __init__(self, threshold: float = 0.9, ttl: float = 3600.0, max_size: int = 512,
+                 tables: int = 8, bits: int = 6):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_size = max_size
+        self.tables = tables
+        self.bits = bits
+        
+        # Hyperplanes are drawn once the embedding width is known
+        self._planes = None
+        self._buckets: List[Dict[bytes, set]] = [{} for _ in range(tables)]
+        
+        # id -> (exact key, vector, signatures, result, stored_at), oldest first
+        self._entries: 'OrderedDict[int, tuple]' = OrderedDict()
+        self._exact: Dict[Tuple[str, str], int] = {}
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def _signatures(self, vector) -> List[bytes]:
+        """One packed sign-bit signature per hash table"""
+        if self._planes is None:
+            rng = np.random.default_rng(0)
+            self._planes = rng.standard_normal((self.tables, self.bits, vector.shape[-1])).astype(np.float32)
+        signs = (self._planes @ vector.reshape(-1)) > 0
+        return [row.tobytes() for row in np.packbits(signs, axis=1)]
+    
+    def _remove(self, entry_id: int):
+        """Drop an entry from every index"""
+        key, _, signatures, _, _ = self._entries.pop(entry_id)
+        self._exact.pop(key, None)
+        for table, signature in zip(self._buckets, signatures or ()):
+            bucket = table.get(signature)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del table[signature]
+    
+    def _fresh(self, entry_id: int, now: float) -> bool:
+        """Whether an entry is within its TTL, removing it if not"""
+        if now - self._entries[entry_id][4] < self.ttl:
+            return True
+        self._remove(entry_id)
+        return False
+    
+    def get(self, query: str, context: str, vector=None) -> Optional[Dict[str, Any]]:
+        """Cached result for this query or a near-duplicate of it under the same context"""
+        now = time.monotonic()
+        key = (query.strip().lower(), context)
+        
+        entry_id = self._exact.get(key)
+        if entry_id is not None and self._fresh(entry_id, now):
+            self.hits += 1
+            return self._entries[entry_id][3]
+        
+        if vector is not None and self._entries:
+            best_id, best_score = None, self.threshold
+            candidates = set()
+            for table, signature in zip(self._buckets, self._signatures(vector)):
+                candidates |= table.get(signature, set())
+            
+            for candidate in candidates:
+                if candidate not in self._entries or not self._fresh(candidate, now):
+                    continue
+                cached_key, cached_vector, _, _, _ = self._entries[candidate]
+                if cached_key[1] != context:
+                    continue
+                score = float(cached_vector @ vector.reshape(-1))
+                if score >= best_score:
+                    best_id, best_score = candidate, score
+            
+            if best_id is not None:
+                self.hits += 1
+                return self._entries[best_id][3]
+        
+        self.misses += 1
+        return None
+    
+    def put(self, query: str, context: str, result: Dict[str, Any], vector=None):
+        """Store a result, evicting the oldest entry when full"""
+        key = (query.strip().lower(), context)
+        if key in self._exact:
+            self._remove(self._exact[key])
+        while len(self._entries) >= self.max_size:
+            self._remove(next(iter(self._entries)))
+        
+        entry_id = self._next_id
+        self._next_id += 1
+        
+        signatures = None
+        if vector is not None:
+            vector = vector.reshape(-1)
+            signatures = self._signatures(vector)
+            for table, signature in zip(self._buckets, signatures):
+                table.setdefault(signature, set()).add(entry_id)
+        
+        self._entries[entry_id] = (key, vector, signatures, result, time.monotonic())
+        self._exact[key] = entry_id
+    
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+# Resolved once at import rather than on every integration instance
+try:
+    import cai
+    CAI_AVAILABLE = True
+except ImportError:
+    cai = None
+    CAI_AVAILABLE = False
+
+from core.shared_utils import ConfigManager, LoggerManager
+from integrations.local_llm_server import LocalLLMAPI
 
 class CAIIntegration:
     """Integration wrapper for CAI framework with local RAG LLM"""
@@ -32,8 +178,28 @@ class CAIIntegration:
         self.use_local_llm = self.config.get('cai', {}).get('use_local_llm', True)
         self.rag_enabled = self.config.get('cai', {}).get('rag_enabled', True)
         
-        # RAG knowledge base
+        # RAG knowledge base, plus an HNSW index over its embeddings once built
         self.knowledge_base = {}
+        self.doc_ids: List[str] = []
+        self._vector_index = None
+        self._encoder = None
+        self.rag_min_similarity = self.config.get('cai', {}).get('rag_min_similarity', 0.3)
+        
+        # Local LLM answers reused for identical or near-identical queries
+        self._answer_cache = _SemanticCache(
+            threshold=self.config.get('cai', {}).get('semantic_cache_threshold', 0.9),
+            ttl=self.config.get('cai', {}).get('semantic_cache_ttl', 3600.0)
+        )
+        
+        # RAG-enhanced agent runners by type; unknown types use the generic agent
+        self._agent_table = {
+            "reconnaissance": self._run_rag_enhanced_recon,
+            "ctf": self._run_rag_enhanced_ctf,
+            "vulnerability_assessment": self._run_rag_enhanced_vuln,
+            "code_analysis": self._run_rag_enhanced_code_analysis,
+            "threat_intelligence": self._run_rag_enhanced_threat_intel,
+        }
+        
         if self.rag_enabled:
             asyncio.create_task(self._initialize_rag_knowledge())
         
@@ -41,13 +207,11 @@ class CAIIntegration:
     
     def _check_cai_availability(self) -> bool:
         """Check if CAI framework is available"""
-        try:
-            import cai
+        if CAI_AVAILABLE:
             self.logger.info("✅ CAI framework available")
-            return True
-        except ImportError:
+        else:
             self.logger.warning("⚠️ CAI framework not available")
-            return False
+        return CAI_AVAILABLE
     
     async def run_cai_agent(self, agent_type: str, task: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Run CAI agent with RAG-enhanced local LLM support"""
@@ -66,18 +230,10 @@ class CAIIntegration:
             }
             
             # Run appropriate agent based on type
-            if agent_type == "reconnaissance":
-                return await self._run_rag_enhanced_recon(task, enhanced_context)
-            elif agent_type == "ctf":
-                return await self._run_rag_enhanced_ctf(task, enhanced_context)
-            elif agent_type == "vulnerability_assessment":
-                return await self._run_rag_enhanced_vuln(task, enhanced_context)
-            elif agent_type == "code_analysis":
-                return await self._run_rag_enhanced_code_analysis(task, enhanced_context)
-            elif agent_type == "threat_intelligence":
-                return await self._run_rag_enhanced_threat_intel(task, enhanced_context)
-            else:
+            runner = self._agent_table.get(agent_type)
+            if runner is None:
                 return await self._run_generic_rag_agent(agent_type, task, enhanced_context)
+            return await runner(task, enhanced_context)
                 
         except Exception as e:
             self.logger.error(f"❌ CAI agent execution failed: {e}")
@@ -346,14 +502,59 @@ Provide detailed cybersecurity guidance."""
             
             self.logger.info(f"📚 RAG knowledge base initialized with {len(self.knowledge_base)} documents")
             
+            # The encoder also drives semantic cache lookups, so it loads even without faiss
+            if SentenceTransformer is not None:
+                await asyncio.to_thread(self._load_encoder)
+            
+            if faiss is not None and self._encoder is not None and self.knowledge_base:
+                await asyncio.to_thread(self._build_vector_index)
+            
         except Exception as e:
             self.logger.error(f"❌ RAG knowledge base initialization failed: {e}")
     
+    def _load_encoder(self):
+        """Load the sentence-transformer used for query and document embeddings"""
+        try:
+            model_name = self.config.get('rag', {}).get('embedding_model', 'intfloat/e5-small-v2')
+            self._encoder = SentenceTransformer(model_name)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Embedding model unavailable, semantic cache limited to exact matches: {e}")
+    
+    def _build_vector_index(self):
+        """Embed every knowledge base document into a cosine-similarity HNSW index"""
+        try:
+            doc_ids = [doc_id for doc_id, doc_data in self.knowledge_base.items() if isinstance(doc_data, dict)]
+            texts = [_document_text(self.knowledge_base[doc_id]) for doc_id in doc_ids]
+            if not doc_ids:
+                return
+            
+            # Unit-length vectors make inner product equal to cosine similarity
+            embeddings = np.asarray(
+                self._encoder.encode(texts, batch_size=32, normalize_embeddings=True), dtype=np.float32
+            )
+            index = faiss.IndexHNSWFlat(embeddings.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+            index.add(embeddings)
+            
+            self.doc_ids, self._vector_index = doc_ids, index
+            self.logger.info(f"🧭 Vector index built over {len(doc_ids)} knowledge base documents")
+            
+        except Exception as e:
+            self.logger.warning(f"⚠️ Vector index unavailable, using keyword scoring: {e}")
+    
     async def query_rag_knowledge(self, query: str, context: str = "") -> Dict[str, Any]:
         """Query RAG knowledge base with local LLM"""
         try:
+            # Embed once for both the answer cache and the vector search
+            vector = None
+            if self._encoder is not None:
+                vector = await asyncio.to_thread(self._encode_query, query)
+            
+            cached = self._answer_cache.get(query, context, vector)
+            if cached is not None:
+                return cached
+            
             # Search relevant documents
-            relevant_docs = await self._search_relevant_documents(query)
+            relevant_docs = await self._search_relevant_documents(query, vector=vector)
             
             # Prepare RAG prompt
             rag_context = self._prepare_rag_context(relevant_docs, query, context)
@@ -377,12 +578,14 @@ Provide detailed cybersecurity guidance."""
                 response = await self.local_llm.chat_completion(messages)
                 
                 if 'error' not in response:
-                    return {
+                    result = {
                         "answer": response['choices'][0]['message']['content'],
                         "sources": [doc['source'] for doc in relevant_docs],
                         "confidence": 0.8,
                         "method": "local_rag"
                     }
+                    self._answer_cache.put(query, context, result, vector)
+                    return result
             
             # Fallback to simple document search
             return await self._fallback_document_search(query, relevant_docs)
@@ -391,8 +594,22 @@ Provide detailed cybersecurity guidance."""
             self.logger.error(f"❌ RAG query failed: {e}")
             return {"error": str(e), "answer": "RAG query failed"}
     
-    async def _search_relevant_documents(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the RAG answer cache"""
+        # Without an encoder only exact repeats of a query can hit
+        return {**self._answer_cache.stats(), 'semantic': self._encoder is not None}
+    
+    def _encode_query(self, query: str):
+        """Unit-length float32 query embedding of shape (1, d)"""
+        return np.asarray(self._encoder.encode([query], normalize_embeddings=True), dtype=np.float32)
+    
+    async def _search_relevant_documents(self, query: str, max_results: int = 5, vector=None) -> List[Dict[str, Any]]:
         """Search for relevant documents in knowledge base"""
+        if self._vector_index is not None:
+            if vector is None:
+                vector = await asyncio.to_thread(self._encode_query, query)
+            return await self._search_vector_index(vector, max_results)
+        
         try:
             query_lower = query.lower()
             relevant_docs = []
@@ -416,6 +633,31 @@ Provide detailed cybersecurity guidance."""
             self.logger.error(f"Document search failed: {e}")
             return []
     
+    async def _search_vector_index(self, vector, max_results: int) -> List[Dict[str, Any]]:
+        """Nearest-neighbour document search over the HNSW index"""
+        try:
+            scores, ids = await asyncio.to_thread(self._vector_index.search, vector, max_results)
+            
+            relevant_docs = []
+            for score, idx in zip(scores[0], ids[0]):
+                # FAISS pads missing neighbours with -1
+                if idx < 0 or score < self.rag_min_similarity:
+                    continue
+                doc_id = self.doc_ids[idx]
+                doc_data = self.knowledge_base[doc_id]
+                relevant_docs.append({
+                    "doc_id": doc_id,
+                    "relevance_score": float(score),
+                    "content": doc_data,
+                    "source": doc_data.get('source', doc_id)
+                })
+            
+            return relevant_docs
+            
+        except Exception as e:
+            self.logger.error(f"Vector document search failed: {e}")
+            return []
+    
     async def _calculate_relevance_score(self, query: str, doc_data: Dict[str, Any]) -> float:
         """Calculate relevance score between query and document"""
         try:
@@ -526,4 +768,3 @@ Provide detailed cybersecurity guidance."""
                 "confidence": 0.0,
                 "method": "error"
             }
-```
@@ -15,7 +15,7 @@ import shlex
 from loguru import logger
 import yaml
 
-from shared_utils import ConfigManager, LoggerManager, DirectoryManager
+from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager, YAMLLoader
 
 class CAIRunner:
     def __init__(self, config: Dict[str, Any] = None):
@@ -545,7 +545,7 @@ if __name__ == "__main__":
     # Test the CAI runner
     async def test_cai_runner():
         with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAMLLoader)
         
         runner = CAIRunner(config)
         
@@ -21,7 +21,6 @@ from transformers import (
 )
 from datasets import Dataset
 from peft import LoraConfig, get_peft_model, TaskType, PeftModel
-import yaml
 from loguru import logger
 import pandas as pd
 from datetime import datetime
@@ -29,7 +28,7 @@ import psutil
 import random
 import re
 
-from shared_utils import ConfigManager, LoggerManager, DirectoryManager
+from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager
 
 class DeepSeekFineTuner:
     """Fine-tuning manager for DeepSeek Coder 1.3B with LoRA"""
@@ -761,9 +760,8 @@ async def main():
     """Main fine-tuning workflow"""
     print("🔧 DeepSeek Coder 1.3B Fine-tuning Workflow")
     
-    # Load config
-    with open('core/config.yaml', 'r') as f:
-        config = yaml.safe_load(f)
+    # Load config (served from the parsed-config sidecar cache when fresh)
+    config = ConfigManager.get_instance().config
     
     # Initialize fine-tuner
     finetuner = DeepSeekFineTuner(config)
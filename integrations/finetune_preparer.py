@@ -15,7 +15,7 @@ import re
 from loguru import logger
 import yaml
 
-from shared_utils import ConfigManager, LoggerManager, DirectoryManager
+from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager, YAMLLoader
 
 class FineTunePreparer:
     def __init__(self, config: Dict[str, Any] = None):
@@ -552,7 +552,7 @@ if __name__ == "__main__":
     # Test the fine-tune preparer
     async def test_finetune_preparer():
         with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAMLLoader)
         
         preparer = FineTunePreparer(config)
         
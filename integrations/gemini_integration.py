@@ -21,9 +21,8 @@ import docx
 from PIL import Image
 import pandas as pd
 from loguru import logger
-import yaml
 
-from shared_utils import ConfigManager, LoggerManager, DirectoryManager
+from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager
 
 class GeminiDocumentProcessor:
     """Gemini-powered document and file extraction processor"""
@@ -619,9 +618,8 @@ async def main():
     """Test Gemini document processor"""
     print("🔮 Testing Gemini Document Processor...")
     
-    # Load config
-    with open('core/config.yaml', 'r') as f:
-        config = yaml.safe_load(f)
+    # Load config (served from the parsed-config sidecar cache when fresh)
+    config = ConfigManager.get_instance().config
     
     try:
         processor = GeminiDocumentProcessor(config)
@@ -18,12 +18,13 @@ from transformers import (
     pipeline,
     BitsAndBytesConfig
 )
+from transformers.pytorch_utils import Conv1D
 from loguru import logger
 import yaml
 from datetime import datetime
 import psutil
 
-from shared_utils import ConfigManager, LoggerManager, DirectoryManager, SystemMetrics
+from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager, SystemMetrics, YAMLLoader
 
 class LocalLLMServer:
     """Local LLM server with memory optimization"""
@@ -39,7 +40,10 @@ class LocalLLMServer:
         
         # Memory management
         self.max_memory_mb = int(os.getenv('MAX_MEMORY_MB', 4096))  # 4GB for model
-        self.device = 'cpu'  # Force CPU for 8GB systems
+        self.device = 'cpu'  # CPU unless a GPU is found at load time
+        
+        # Weight precision: int4, int8, bf16 or fp16
+        self.quantization = self.config.get('cai', {}).get('quantization', 'int4')
         
         # Setup directories
         DirectoryManager.ensure_directory("models/local")
@@ -62,6 +66,63 @@ class LocalLLMServer:
             # Low memory: Use tiny model
             return "distilgpt2"
     
+    def _load_kwargs(self, on_gpu: bool) -> Dict[str, Any]:
+        """from_pretrained arguments for the configured precision"""
+        if not on_gpu:
+            # CPU weights are quantized after loading, see _quantize_for_cpu
+            return {'torch_dtype': torch.bfloat16 if self.quantization == 'bf16' else torch.float32}
+        
+        compute_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        kwargs = {'device_map': 'auto', 'torch_dtype': compute_dtype}
+        
+        if self.quantization == 'int4':
+            kwargs['quantization_config'] = BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=compute_dtype,
+                bnb_4bit_use_double_quant=True
+            )
+        elif self.quantization == 'int8':
+            kwargs['quantization_config'] = BitsAndBytesConfig(
+                load_in_8bit=True,
+                llm_int8_enable_fp32_cpu_offload=True
+            )
+        elif self.quantization == 'fp16':
+            kwargs['torch_dtype'] = torch.float16
+        
+        return kwargs
+    
+    def _quantize_for_cpu(self, model):
+        """Weight-only quantization with IPEX when installed, dynamic INT8 otherwise"""
+        if self.quantization not in ('int4', 'int8'):
+            return model
+        
+        model.eval()
+        try:
+            import intel_extension_for_pytorch as ipex
+            from intel_extension_for_pytorch.quantization import WoqWeightDtype
+            
+            weight_dtype = WoqWeightDtype.INT4 if self.quantization == 'int4' else WoqWeightDtype.INT8
+            qconfig = ipex.quantization.get_weight_only_quant_qconfig_mapping(weight_dtype=weight_dtype)
+            model = ipex.llm.optimize(model, quantization_config=qconfig, inplace=True)
+            logger.info(f"⚡ IPEX weight-only {self.quantization} quantization applied")
+            return model
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ IPEX quantization failed: {e}")
+        
+        # GPT-2 style models (DialoGPT, distilgpt2) keep their weights in Conv1D, where
+        # quantize_dynamic would only touch the tied lm_head and duplicate its weights
+        if any(isinstance(module, Conv1D) for module in model.modules()):
+            logger.info(f"ℹ️ No {self.quantization} quantization applied: {self.model_name} uses Conv1D layers")
+            return model
+        
+        # Linear layers carry nearly all the weights; torch quantizes them natively
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        logger.info("⚡ Dynamic INT8 quantization applied to linear layers")
+        return model
+    
     async def initialize(self):
         """Initialize the local LLM with memory optimization"""
         self.logger.info(f"🔧 Initializing local LLM: {self.model_name}")
@@ -75,11 +136,9 @@ class LocalLLMServer:
                 self.logger.warning(f"⚠️  Low available memory: {available_gb:.1f}GB")
                 return False
             
-            # Configure quantization for memory efficiency
-            quantization_config = BitsAndBytesConfig(
-                load_in_8bit=True,
-                llm_int8_enable_fp32_cpu_offload=True
-            ) if torch.cuda.is_available() else None
+            # GPUs quantize while loading; CPU weights are quantized afterwards
+            on_gpu = torch.cuda.is_available()
+            self.device = 'cuda' if on_gpu else 'cpu'
             
             # Load tokenizer
             logger.info("📚 Loading tokenizer...")
@@ -97,24 +156,21 @@ class LocalLLMServer:
             logger.info("🧠 Loading model...")
             self.model = AutoModelForCausalLM.from_pretrained(
                 self.model_name,
-                quantization_config=quantization_config,
-                torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
-                device_map="auto" if torch.cuda.is_available() else None,
                 low_cpu_mem_usage=True,
                 cache_dir="models/local",
-                trust_remote_code=True
+                trust_remote_code=True,
+                **self._load_kwargs(on_gpu)
             )
             
-            # Move to CPU if needed
-            if self.device == 'cpu':
-                self.model = self.model.to('cpu')
+            if not on_gpu:
+                self.model = self._quantize_for_cpu(self.model)
             
-            # Create pipeline
+            # Create pipeline (device_map already placed GPU weights)
             self.pipeline = pipeline(
                 "text-generation",
                 model=self.model,
                 tokenizer=self.tokenizer,
-                device=0 if torch.cuda.is_available() else -1,
+                **({} if on_gpu else {'device': -1}),
                 max_length=512,  # Limit for memory
                 do_sample=True,
                 temperature=0.7,
@@ -277,6 +333,7 @@ Category:"""
                 'status': 'ready',
                 'model_name': self.model_name,
                 'device': self.device,
+                'quantization': self.quantization,
                 'memory_usage_mb': round(memory_mb, 1),
                 'max_tokens': 512,
                 'supports_streaming': False
@@ -371,7 +428,7 @@ async def main():
     
     # Load config
     with open('config.yaml', 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAMLLoader)
     
     # Initialize server
     api = LocalLLMAPI(config)
@@ -15,7 +15,7 @@ pentestgpt_path = Path(__file__).parent.parent / "PentestGPT"
 if pentestgpt_path.exists():
     sys.path.insert(0, str(pentestgpt_path))
 
-from shared_utils import ConfigManager, LoggerManager
+from core.shared_utils import ConfigManager, LoggerManager
 
 class PentestGPTIntegration:
     """Integration wrapper for PentestGPT framework"""
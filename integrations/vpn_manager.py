@@ -19,9 +19,8 @@ from datetime import datetime, timedelta
 import psutil
 import requests
 from loguru import logger
-import yaml
 
-from shared_utils import ConfigManager, LoggerManager, DirectoryManager
+from core.shared_utils import ConfigManager, LoggerManager, DirectoryManager
 
 class VPNManager:
     """Manage VPN connections for penetration testing environments"""
@@ -658,9 +657,8 @@ async def main():
     """Test VPN manager"""
     print("🔒 Testing VPN Manager...")
     
-    # Load config
-    with open('core/config.yaml', 'r') as f:
-        config = yaml.safe_load(f)
+    # Load config (served from the parsed-config sidecar cache when fresh)
+    config = ConfigManager.get_instance().config
     
     try:
         vpn_manager = VPNManager(config)
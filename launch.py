@@ -44,10 +44,11 @@ if __name__ == "__main__":
                 print(f"❌ Missing dependency: {e}")
                 sys.exit(1)
         
-        from core.main import CyberAgentPlatform
+        from core.main import CyberAgentPlatform, install_event_loop_policy
         
         print("🚀 Starting Cybersecurity AI Agent Platform...")
         platform = CyberAgentPlatform()
+        install_event_loop_policy()
         asyncio.run(platform.run())
         
     except KeyboardInterrupt:
@@ -30,7 +30,7 @@ async def test_scan_functionality():
         result = await task_router.route_scan_task(test_target)
         
         logger.info("✅ Scan completed successfully!")
-        logger.info(f"📋 Result summary: {result.get('summary', 'No summary available')}")
+        logger.info(f"📋 Result summary: {result.summary}")
         
         return True
         
@@ -0,0 +1,11 @@
+"""Shared pytest setup: make the project packages importable from tests/"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Script-style integration runners, executed directly rather than collected
+collect_ignore = ["test_integration.py", "final_integration.py"]
@@ -0,0 +1,47 @@
+"""Unit tests for per-chat handler serialization in the Telegram bot"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+telegram_bot = pytest.importorskip("core.telegram_bot")
+CybersecurityBot = telegram_bot.CybersecurityBot
+
+
+def _update(chat_id):
+    return SimpleNamespace(effective_chat=SimpleNamespace(id=chat_id))
+
+
+def test_same_chat_runs_one_handler_at_a_time_and_lock_is_released():
+    bot = CybersecurityBot.__new__(CybersecurityBot)
+    bot._chat_locks = {}
+    active = 0
+    peak = 0
+    
+    async def handler(update, context):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+    
+    async def scenario():
+        wrapped = bot._per_chat(handler)
+        await asyncio.gather(*(wrapped(_update(1), None) for _ in range(3)))
+    
+    asyncio.run(scenario())
+    assert peak == 1
+    assert bot._chat_locks == {}
+
+
+def test_lock_is_released_when_handler_fails():
+    bot = CybersecurityBot.__new__(CybersecurityBot)
+    bot._chat_locks = {}
+    
+    async def handler(update, context):
+        raise RuntimeError("handler failed")
+    
+    with pytest.raises(RuntimeError):
+        asyncio.run(bot._per_chat(handler)(_update(7), None))
+    assert bot._chat_locks == {}
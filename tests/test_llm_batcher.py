@@ -0,0 +1,137 @@
+"""Unit tests for the LLM micro-batcher"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("loguru")
+
+from core.llm_batcher import LLMBatcher
+
+
+def test_concurrent_prompts_share_one_deduplicated_batch():
+    calls = []
+    
+    async def handler(prompts):
+        calls.append(list(prompts))
+        return [p.upper() for p in prompts]
+    
+    async def scenario():
+        batcher = LLMBatcher(handler, max_batch_size=2, flush_interval=1.0)
+        results = await asyncio.gather(*(batcher.submit(p) for p in ("x", "y", "x")))
+        await batcher.close()
+        return results
+    
+    assert asyncio.run(scenario()) == ["X", "Y", "X"]
+    assert calls == [["x", "y"]]
+
+
+def test_lone_prompt_is_not_held_for_flush_interval():
+    async def handler(prompts):
+        return prompts
+    
+    async def scenario():
+        batcher = LLMBatcher(handler, flush_interval=30.0)
+        try:
+            return await asyncio.wait_for(batcher.submit("only"), timeout=1.0)
+        finally:
+            await batcher.close()
+    
+    assert asyncio.run(scenario()) == "only"
+
+
+def test_prompt_arriving_mid_batch_does_not_queue_behind_it():
+    async def handler(prompts):
+        await asyncio.sleep(0.2)
+        return prompts
+    
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        batcher = LLMBatcher(handler, flush_interval=0.01)
+        first = asyncio.ensure_future(batcher.submit("first"))
+        await asyncio.sleep(0.05)
+        
+        started = loop.time()
+        second = await batcher.submit("second")
+        elapsed = loop.time() - started
+        
+        await first
+        await batcher.close()
+        return second, elapsed
+    
+    second, elapsed = asyncio.run(scenario())
+    assert second == "second"
+    assert elapsed < 0.35
+
+
+def test_identical_prompt_joins_call_already_in_flight():
+    calls = []
+    
+    async def handler(prompts):
+        calls.append(list(prompts))
+        await asyncio.sleep(0.05)
+        return [p.upper() for p in prompts]
+    
+    async def scenario():
+        batcher = LLMBatcher(handler, flush_interval=0.01)
+        first = asyncio.ensure_future(batcher.submit("x"))
+        await asyncio.sleep(0.02)
+        second = await batcher.submit("x")
+        result = (await first, second)
+        await batcher.close()
+        return result
+    
+    assert asyncio.run(scenario()) == ("X", "X")
+    assert calls == [["x"]]
+
+
+def test_cancelled_caller_does_not_cancel_shared_prompt():
+    async def handler(prompts):
+        await asyncio.sleep(0.02)
+        return prompts
+    
+    async def scenario():
+        batcher = LLMBatcher(handler)
+        first = asyncio.ensure_future(batcher.submit("x"))
+        second = asyncio.ensure_future(batcher.submit("x"))
+        await asyncio.sleep(0)
+        first.cancel()
+        result = await second
+        await batcher.close()
+        return result
+    
+    assert asyncio.run(scenario()) == "x"
+
+
+def test_handler_error_reaches_every_waiter():
+    async def handler(prompts):
+        raise RuntimeError("backend down")
+    
+    async def scenario():
+        batcher = LLMBatcher(handler, max_batch_size=2, flush_interval=1.0)
+        results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+        await batcher.close()
+        return results
+    
+    results = asyncio.run(scenario())
+    assert len(results) == 2
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_close_resolves_pending_futures_and_rejects_new_prompts():
+    async def handler(prompts):
+        await asyncio.sleep(0.05)
+        return [p * 2 for p in prompts]
+    
+    async def scenario():
+        batcher = LLMBatcher(handler, max_batch_size=8, flush_interval=1.0)
+        pending = [asyncio.ensure_future(batcher.submit(p)) for p in ("a", "b", "c")]
+        await asyncio.sleep(0)
+        await batcher.close()
+        
+        assert all(f.done() for f in pending)
+        with pytest.raises(RuntimeError):
+            await batcher.submit("late")
+        return [f.result() for f in pending]
+    
+    assert asyncio.run(scenario()) == ["aa", "bb", "cc"]
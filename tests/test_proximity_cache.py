@@ -0,0 +1,78 @@
+"""Unit tests for the task router's embedding proximity cache"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+task_router = pytest.importorskip("core.task_router")
+_ProximityCache = task_router._ProximityCache
+
+
+def _unit(*values):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_near_vector_hits_and_far_vector_misses():
+    cache = _ProximityCache(tau=0.05)
+    cache.put("rag", _unit(1, 0, 0), "query", None, {"answer": 1})
+    
+    assert cache.get("rag", _unit(1, 0.1, 0)) == {"answer": 1}
+    assert cache.get("rag", _unit(0, 1, 0)) is None
+
+
+def test_namespace_and_context_are_isolated():
+    cache = _ProximityCache()
+    cache.put("rag", _unit(1, 0, 0), "query", "web", {"answer": 1})
+    
+    assert cache.get("rag", _unit(1, 0, 0), "web") == {"answer": 1}
+    assert cache.get("rag", _unit(1, 0, 0), "network") is None
+    assert cache.get("analysis", _unit(1, 0, 0), "web") is None
+
+
+def test_zero_and_mismatched_vectors_are_ignored():
+    cache = _ProximityCache()
+    cache.put("rag", np.zeros(3), "query", None, {"answer": 0})
+    assert cache.get("rag", _unit(1, 0, 0)) is None
+    
+    cache.put("rag", _unit(1, 0, 0), "query", None, {"answer": 1})
+    assert cache.get("rag", _unit(1, 0, 0, 0)) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = _ProximityCache(max_size=2)
+    cache.put("rag", _unit(1, 0, 0), "a", None, {"answer": "a"})
+    cache.put("rag", _unit(0, 1, 0), "b", None, {"answer": "b"})
+    
+    # Touch "a" so "b" becomes the eviction candidate
+    assert cache.get("rag", _unit(1, 0, 0)) == {"answer": "a"}
+    cache.put("rag", _unit(0, 0, 1), "c", None, {"answer": "c"})
+    
+    assert cache.get("rag", _unit(0, 1, 0)) is None
+    assert cache.get("rag", _unit(1, 0, 0)) == {"answer": "a"}
+    assert cache.get("rag", _unit(0, 0, 1)) == {"answer": "c"}
+
+
+def test_nearest_returns_evidence_ids():
+    cache = _ProximityCache()
+    cache.put("rag", _unit(1, 0, 0), "query", None, {"answer": 1}, evidence_ids={"doc-1"})
+    
+    query, context, result, _, evidence_ids = cache.nearest("rag", _unit(1, 0, 0))
+    assert (query, context, result, evidence_ids) == ("query", None, {"answer": 1}, {"doc-1"})
+
+
+def test_expired_entry_is_not_served():
+    cache = _ProximityCache(ttl=-1.0)
+    cache.put("rag", _unit(1, 0, 0), "query", None, {"answer": 1})
+    
+    assert cache.get("rag", _unit(1, 0, 0)) is None
+
+
+def test_clear_drops_only_matching_namespaces():
+    cache = _ProximityCache()
+    cache.put("search:*", _unit(1, 0, 0), "query", None, {"answer": "search"})
+    cache.put("thinking", _unit(1, 0, 0), "query", None, {"answer": "thinking"})
+    
+    cache.clear("search:")
+    
+    assert cache.get("search:*", _unit(1, 0, 0)) is None
+    assert cache.get("thinking", _unit(1, 0, 0)) == {"answer": "thinking"}
@@ -0,0 +1,102 @@
+"""Unit tests for request coalescing in the Telegram bot"""
+
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+telegram_bot = pytest.importorskip("core.telegram_bot")
+CybersecurityBot = telegram_bot.CybersecurityBot
+
+
+def _bot():
+    """Bot with only the coalescing state initialised"""
+    bot = CybersecurityBot.__new__(CybersecurityBot)
+    bot._inflight = {}
+    bot._results = OrderedDict()
+    return bot
+
+
+def test_identical_concurrent_requests_share_one_call():
+    calls = 0
+    
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"answer": calls}
+    
+    async def scenario():
+        bot = _bot()
+        results = await asyncio.gather(
+            bot._coalesce("think", "What is XSS?", call),
+            bot._coalesce("think", "  what is xss?", call),
+        )
+        assert not bot._inflight
+        
+        # The completed result is served from cache without a new call
+        cached = await bot._coalesce("think", "what is xss?", call)
+        other_kind = await bot._coalesce("scan", "what is xss?", call)
+        return results, cached, other_kind
+    
+    results, cached, other_kind = asyncio.run(scenario())
+    assert results == [{"answer": 1}, {"answer": 1}]
+    assert cached == {"answer": 1}
+    assert other_kind == {"answer": 2}
+    assert calls == 2
+
+
+def test_failed_call_is_not_cached():
+    attempts = 0
+    
+    async def call():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("upstream error")
+        return "ok"
+    
+    async def scenario():
+        bot = _bot()
+        with pytest.raises(RuntimeError):
+            await bot._coalesce("think", "query", call)
+        assert not bot._results and not bot._inflight
+        return await bot._coalesce("think", "query", call)
+    
+    assert asyncio.run(scenario()) == "ok"
+    assert attempts == 2
+
+
+def test_cancelled_requester_does_not_cancel_shared_call():
+    async def call():
+        await asyncio.sleep(0.02)
+        return "done"
+    
+    async def scenario():
+        bot = _bot()
+        first = asyncio.ensure_future(bot._coalesce("scan", "host", call))
+        second = asyncio.ensure_future(bot._coalesce("scan", "host", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+    
+    assert asyncio.run(scenario()) == "done"
+
+
+def test_expired_result_triggers_new_call(monkeypatch):
+    monkeypatch.setattr(CybersecurityBot, "RESULT_TTL", 0.0)
+    calls = 0
+    
+    async def call():
+        nonlocal calls
+        calls += 1
+        return calls
+    
+    async def scenario():
+        bot = _bot()
+        first = await bot._coalesce("think", "query", call)
+        second = await bot._coalesce("think", "query", call)
+        return first, second
+    
+    assert asyncio.run(scenario()) == (1, 2)
+    assert calls == 2
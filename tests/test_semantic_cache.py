@@ -0,0 +1,48 @@
+"""Unit tests for the RAG answer cache in the CAI integration"""
+
+import pytest
+
+cai_integration = pytest.importorskip("integrations.cai_integration")
+_SemanticCache = cai_integration._SemanticCache
+
+
+def test_exact_hit_ignores_case_and_whitespace():
+    cache = _SemanticCache()
+    cache.put("What is XSS?", "web", {"answer": "cross-site scripting"})
+    
+    assert cache.get("  what is xss? ", "web") == {"answer": "cross-site scripting"}
+    assert cache.get("What is XSS?", "network") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entry_is_dropped():
+    cache = _SemanticCache(ttl=0.0)
+    cache.put("query", "ctx", {"answer": 1})
+    
+    assert cache.get("query", "ctx") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_oldest_entry_is_evicted_when_full():
+    cache = _SemanticCache(max_size=2)
+    for query in ("a", "b", "c"):
+        cache.put(query, "ctx", {"answer": query})
+    
+    assert cache.get("a", "ctx") is None
+    assert cache.get("b", "ctx") == {"answer": "b"}
+    assert cache.get("c", "ctx") == {"answer": "c"}
+
+
+def test_near_duplicate_vector_hits_under_same_context():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(1)
+    base = rng.standard_normal(64).astype(np.float32)
+    base /= np.linalg.norm(base)
+    near = base + 0.02 * rng.standard_normal(64).astype(np.float32)
+    near /= np.linalg.norm(near)
+    
+    cache = _SemanticCache()
+    cache.put("how do I scan ports", "ctx", {"answer": "nmap"}, vector=base)
+    
+    assert cache.get("port scanning how-to", "ctx", vector=near) == {"answer": "nmap"}
+    assert cache.get("port scanning how-to", "other", vector=near) is None